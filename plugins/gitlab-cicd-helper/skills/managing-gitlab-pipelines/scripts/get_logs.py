@@ -49,16 +49,29 @@ Batch Mode Examples:
 
 import sys
 import argparse
+import fnmatch
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count as count_from, islice
 from pathlib import Path
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+try:
+    import re2  # Optional: google-re2, linear-time matching for user patterns
+except ImportError:
+    re2 = None
+
 # Add lib directory to path
 sys.path.insert(0, str(Path(__file__).parent / "lib"))
 
+from gitlab.v4.objects import ProjectJob
 from gitlab_config import GitLabConfig
-from pipeline_analyzer import PipelineAnalyzer
 from project_resolver import ProjectResolver
-from batch_log_fetcher import BatchLogFetcher
 
 
 def parse_args():
@@ -164,6 +177,12 @@ def parse_args():
         help="[Batch] Generate summary report with statistics"
     )
 
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="[Batch] Write logs and aggregate gzip-compressed (.log.gz; read with zless/zgrep)"
+    )
+
     parser.add_argument(
         "--no-empty",
         action="store_true",
@@ -175,7 +194,7 @@ def parse_args():
         "--parallel",
         type=int,
         default=5,
-        help="[Batch] Number of parallel log fetches (default: 5, max: 10)"
+        help="[Batch] Number of parallel log fetches (default: 5, max: 32)"
     )
 
     # Output filtering (applies to both single and batch mode)
@@ -231,8 +250,8 @@ def parse_args():
     if args.batch:
         if not args.pipeline:
             parser.error("--batch requires --pipeline")
-        if args.parallel > 10:
-            parser.error("--parallel cannot exceed 10 (API rate limit protection)")
+        if args.parallel > 32:
+            parser.error("--parallel cannot exceed 32 (API rate limit protection)")
     else:
         # Single job mode
         if not args.job and not args.job_name:
@@ -243,79 +262,255 @@ def parse_args():
         # Batch-only options in single job mode
         if args.all or args.failed_only or args.status or args.stage or args.pattern:
             parser.error("--all, --failed-only, --status, --stage, --pattern require --batch")
-        if args.output_dir or args.aggregate or args.summary:
-            parser.error("--output-dir, --aggregate, --summary require --batch")
+        if args.output_dir or args.aggregate or args.summary or args.compress:
+            parser.error("--output-dir, --aggregate, --summary, --compress require --batch")
 
     return args
 
 
-def filter_logs(logs, pattern=None, ignore_case=False, context=0):
-    """Filter log lines by pattern.
+def iter_lines(logs):
+    """Yield log lines one at a time without building the full split list.
+
+    Args:
+        logs: Log text
+
+    Yields:
+        Lines without their trailing newline
+    """
+    start = 0
+    find = logs.find
+    while True:
+        end = find('\n', start)
+        if end < 0:
+            yield logs[start:]
+            return
+        yield logs[start:end]
+        start = end + 1
+
+
+def iter_lines_reversed(logs):
+    """Yield log lines from last to first, scanning backwards.
 
     Args:
         logs: Log text
+
+    Yields:
+        Lines without their trailing newline, in reverse order
+    """
+    end = len(logs)
+    rfind = logs.rfind
+    while True:
+        start = rfind('\n', 0, end) + 1
+        yield logs[start:end]
+        if start == 0:
+            return
+        end = start - 1
+
+
+def extract_required_literal(pattern):
+    """Extract the longest literal substring that every match must contain.
+
+    Only top-level literal runs are considered, so text inside groups,
+    alternations and repeats never produces a false requirement.
+
+    Args:
+        pattern: Regex pattern
+
+    Returns:
+        Required literal string, or None if the pattern has none
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+
+    longest = ''
+    run = []
+    for op, arg in parsed:
+        if op is sre_parse.LITERAL:
+            run.append(chr(arg))
+            continue
+        if len(run) > len(longest):
+            longest = ''.join(run)
+        run = []
+    if len(run) > len(longest):
+        longest = ''.join(run)
+
+    return longest or None
+
+
+def compile_grep(pattern, ignore_case=False):
+    """Build a line matcher for a grep pattern.
+
+    Lines lacking the pattern's required literal are rejected with a
+    C-level substring check before the regex runs. When google-re2 is
+    installed it does the matching, so a pathological pattern can't
+    backtrack for minutes; patterns RE2 can't express fall back to re.
+
+    Args:
         pattern: Regex pattern to match
         ignore_case: Case-insensitive matching
-        context: Number of context lines around matches
 
     Returns:
-        Filtered log lines
+        Callable taking a line and returning a truthy match, or None if
+        the pattern is invalid
     """
-    if not pattern:
-        return logs
-
-    lines = logs.split('\n')
     flags = re.IGNORECASE if ignore_case else 0
 
     try:
         regex = re.compile(pattern, flags)
     except re.error as e:
         print(f"⚠️  Invalid regex pattern: {e}")
-        return logs
+        return None
+
+    search = regex.search
+    if re2 is not None:
+        try:
+            search = re2.compile(('(?i)' if ignore_case else '') + pattern).search
+        except re2.error:
+            print("⚠️  Pattern uses features RE2 lacks (backreferences, lookaround); using Python re")
+
+    needle = extract_required_literal(pattern)
+    if needle and regex.flags & re.IGNORECASE:
+        if needle.isascii():
+            needle = needle.lower()
+
+            def search(line, _search=search):
+                # Non-ASCII lines may case-fold in ways str.lower() doesn't
+                return (not line.isascii() or needle in line.lower()) and _search(line)
+    elif needle:
+        def search(line, _search=search):
+            return needle in line and _search(line)
+
+    return search
 
-    # Find matching line indices
-    matching_indices = set()
-    for i, line in enumerate(lines):
-        if regex.search(line):
-            # Add the matching line and context
-            for j in range(max(0, i - context), min(len(lines), i + context + 1)):
-                matching_indices.add(j)
 
-    # Build filtered output
-    filtered_lines = []
-    for i in sorted(matching_indices):
-        filtered_lines.append(lines[i])
+def grep_lines(lines, search, context=0):
+    """Yield matching lines plus context in a single pass.
 
-    return '\n'.join(filtered_lines)
+    Lines before a match are held in a ring buffer of size `context`,
+    lines after a match are emitted while a counter runs down.
+
+    Args:
+        lines: Iterable of log lines
+        search: Line matcher from compile_grep()
+        context: Number of context lines around matches
+
+    Yields:
+        Matching and context lines in log order
+    """
+    before = deque(maxlen=context) if context > 0 else None
+    remaining_after = 0
+
+    for line in lines:
+        if search(line):
+            # Flush pre-context, then the matching line itself
+            if before:
+                yield from before
+                before.clear()
+            yield line
+            remaining_after = context
+        elif remaining_after > 0:
+            yield line
+            remaining_after -= 1
+        elif before is not None:
+            before.append(line)
+
+
+def process_logs(logs, *, grep=None, ignore_case=False, context=0, tail=None, line_numbers=False):
+    """Apply grep, tail and line numbering to logs in one pass.
+
+    Lines stream through grep and are numbered on output, so no intermediate
+    joined string is built between steps. With --tail, grep scans backwards
+    from the end of the log and stops after the last N output lines.
+
+    Args:
+        logs: Log text
+        grep: Regex pattern to match (invalid patterns are ignored)
+        ignore_case: Case-insensitive matching
+        context: Number of context lines around matches
+        tail: Keep only the last N lines of the (filtered) output
+        line_numbers: Prefix output lines with line numbers
+
+    Returns:
+        Processed log text
+    """
+    tail = tail if tail and tail > 0 else None
+    search = compile_grep(grep, ignore_case) if grep else None
+
+    if search is None:
+        # No grep: tail by scanning backwards, never touching earlier lines
+        text = tail_logs(logs, tail) if tail else logs
+        if not line_numbers:
+            return text
+        lines = iter_lines(text)
+        count = count_lines(text)
+    else:
+        if tail:
+            # Grep from the end and stop once `tail` lines are collected.
+            # Context windows are symmetric, so grepping the reversed lines
+            # yields exactly the forward output in reverse.
+            matched = grep_lines(iter_lines_reversed(logs), search, context)
+            lines = list(islice(matched, tail))
+            lines.reverse()
+        else:
+            lines = list(grep_lines(iter_lines(logs), search, context))
+        if not line_numbers:
+            return '\n'.join(lines)
+        count = len(lines)
+
+    return '\n'.join(number_lines(lines, count))
 
 
 def tail_logs(logs, n):
     """Get last N lines of logs.
 
+    Walks backwards with rfind so only the returned suffix is copied.
+
     Args:
-        logs: Log text
+        logs: Log text (str or raw bytes)
         n: Number of lines
 
     Returns:
-        Last N lines
+        Last N lines, same type as logs
     """
-    lines = logs.split('\n')
-    return '\n'.join(lines[-n:])
+    if n <= 0:
+        return logs
+
+    newline = b'\n' if isinstance(logs, bytes) else '\n'
+    pos = len(logs)
+    for _ in range(n):
+        pos = logs.rfind(newline, 0, pos)
+        if pos < 0:
+            return logs
+    return logs[pos + 1:]
 
 
-def add_line_numbers(logs):
-    """Add line numbers to logs.
+def count_lines(logs):
+    """Count log lines without splitting the text into a list.
 
     Args:
-        logs: Log text
+        logs: Log text (str or raw bytes)
+
+    Returns:
+        Number of lines
+    """
+    return logs.count(b'\n' if isinstance(logs, bytes) else '\n') + 1
+
+
+def number_lines(lines, count):
+    """Prefix lines with right-aligned line numbers.
+
+    Args:
+        lines: Iterable of log lines
+        count: Total number of lines (sets the number column width)
 
     Returns:
-        Logs with line numbers
+        Iterator of numbered lines
     """
-    lines = logs.split('\n')
-    width = len(str(len(lines)))
-    numbered = [f"{i+1:>{width}}│ {line}" for i, line in enumerate(lines)]
-    return '\n'.join(numbered)
+    # Build the format once rather than re-parsing the width spec per line
+    fmt = ("{:>%d}│ {}" % len(str(count))).format
+    return map(fmt, count_from(1), lines)
 
 
 def handle_batch_mode(args, gl, project, analyzer):
@@ -333,8 +528,8 @@ def handle_batch_mode(args, gl, project, analyzer):
     # Determine output directory
     output_dir = args.output_dir or f"/tmp/gitlab-logs-{args.pipeline}"
 
-    # Get pipeline info
-    pipeline = project.pipelines.get(args.pipeline)
+    # Get pipeline info (cached by the analyzer for the job listing below)
+    pipeline = analyzer.get_pipeline(args.pipeline)
     branch = pipeline.ref
 
     print(f"\n📋 Batch Log Collection")
@@ -357,26 +552,32 @@ def handle_batch_mode(args, gl, project, analyzer):
     if args.failed_only:
         filters['status'] = ['failed']
 
-    # Get jobs based on filters
+    # Get jobs based on filters (one paginated listing, scoped server-side)
+    scope = None
     if args.all:
         print("🔍 Collecting logs from ALL jobs in pipeline...")
-        jobs = analyzer.get_all_jobs(args.pipeline)
     elif filters['status']:
         print(f"🔍 Filtering jobs by status: {', '.join(filters['status'])}")
-        jobs = analyzer.get_all_jobs(args.pipeline, scope=filters['status'])
-    else:
-        # Default: get all jobs, will filter later
-        jobs = analyzer.get_all_jobs(args.pipeline)
+        scope = filters['status']
+
+    jobs = analyzer.get_all_jobs(args.pipeline, scope=scope)
 
-    # Apply additional filters
-    if filters['stage']:
-        print(f"🔍 Filtering jobs by stage: {filters['stage']}")
-        jobs = [j for j in jobs if j.stage == filters['stage']]
+    # Apply additional filters (single pass, glob compiled once)
+    stage = filters['stage']
+    name_match = None
+
+    if stage:
+        print(f"🔍 Filtering jobs by stage: {stage}")
 
     if filters['pattern']:
-        import fnmatch
         print(f"🔍 Filtering jobs by pattern: {filters['pattern']}")
-        jobs = [j for j in jobs if fnmatch.fnmatch(j.name, filters['pattern'])]
+        name_match = re.compile(fnmatch.translate(filters['pattern'])).match
+
+    if stage or name_match:
+        jobs = [
+            j for j in jobs
+            if (not stage or j.stage == stage) and (name_match is None or name_match(j.name))
+        ]
 
     # Apply max-jobs limit
     if args.max_jobs and len(jobs) > args.max_jobs:
@@ -390,7 +591,9 @@ def handle_batch_mode(args, gl, project, analyzer):
     print(f"✅ Found {len(jobs)} jobs to process\n")
 
     # Initialize batch fetcher
-    fetcher = BatchLogFetcher(gl, project.id, args.pipeline, output_dir)
+    from batch_log_fetcher import BatchLogFetcher  # batch-only; keeps --job startup light
+
+    fetcher = BatchLogFetcher(gl, project.id, args.pipeline, output_dir, compress=args.compress)
 
     # Create directory structure
     fetcher.create_directory_structure(jobs)
@@ -404,6 +607,12 @@ def handle_batch_mode(args, gl, project, analyzer):
             'ignore_case': args.ignore_case,
             'context': args.context
         }
+        if args.grep:
+            # Same matcher as single-job mode (literal prefilter, RE2 when available)
+            search = compile_grep(args.grep, args.ignore_case)
+            if search is None:
+                return 1
+            log_filters['search'] = search
 
     # Fetch logs in batch
     results = fetcher.fetch_logs_batch(
@@ -454,9 +663,12 @@ def handle_batch_mode(args, gl, project, analyzer):
 
     print(f"\n💡 Quick actions:")
     print(f"   • View failed jobs:  cd {output_dir}/by-status && ls -lh")
-    print(f"   • Search all logs:   grep -r 'ERROR' {output_dir}/all/")
+    if args.compress:
+        print(f"   • Search all logs:   zgrep 'ERROR' {output_dir}/all/*.gz")
+    else:
+        print(f"   • Search all logs:   grep -r 'ERROR' {output_dir}/all/")
     if args.aggregate:
-        print(f"   • View aggregate:    less {aggregate_path}")
+        print(f"   • View aggregate:    {'zless' if args.compress else 'less'} {aggregate_path}")
 
     return 0
 
@@ -489,7 +701,9 @@ def handle_single_job(args, gl, project, analyzer):
                 print(f"   - ID: {j.id}, Status: {j.status}")
             print(f"\n   Using most recent job (ID: {jobs[0].id})")
 
-        job = project.jobs.get(jobs[0].id)
+        # The pipeline listing already carries the full job fields; wrap it as a
+        # project job (which has trace()) instead of fetching it again
+        job = ProjectJob(project.jobs, jobs[0].attributes)
     else:
         # Get job by ID
         print(f"📋 Getting job {args.job} details...")
@@ -500,7 +714,9 @@ def handle_single_job(args, gl, project, analyzer):
     # Get job logs using python-gitlab
     print("📥 Downloading job trace...")
     try:
-        logs = job.trace().decode('utf-8')
+        # Kept as raw bytes unless grep/numbering needs text, so the trace
+        # isn't decoded and re-encoded just to be written back out
+        logs = job.trace()
     except Exception as e:
         print(f"❌ Failed to get job trace: {e}")
         print(f"   Job may not have started yet or logs may not be available")
@@ -513,14 +729,24 @@ def handle_single_job(args, gl, project, analyzer):
     # Apply filters
     if args.grep:
         print(f"🔍 Filtering for pattern: {args.grep}")
-        logs = filter_logs(logs, args.grep, args.ignore_case, args.context)
 
     if args.tail:
         print(f"📄 Showing last {args.tail} lines")
-        logs = tail_logs(logs, args.tail)
 
-    if args.line_numbers:
-        logs = add_line_numbers(logs)
+    if args.grep or args.line_numbers:
+        if args.tail and not args.grep:
+            # Only the last N lines get numbered: trim the bytes before decoding
+            logs = tail_logs(logs, args.tail)
+        logs = process_logs(
+            logs.decode('utf-8', errors='replace'),
+            grep=args.grep,
+            ignore_case=args.ignore_case,
+            context=args.context,
+            tail=args.tail,
+            line_numbers=args.line_numbers
+        ).encode('utf-8')
+    elif args.tail:
+        logs = tail_logs(logs, args.tail)
 
     # Output logs
     print("\n" + "="*60)
@@ -528,19 +754,22 @@ def handle_single_job(args, gl, project, analyzer):
     print("="*60 + "\n")
 
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(logs)
+        Path(args.output).write_bytes(logs)
         print(f"✅ Logs saved to: {args.output}")
         print(f"\n📊 Log statistics:")
-        print(f"   Total lines: {len(logs.split(chr(10)))}")
+        print(f"   Total lines: {count_lines(logs)}")
         print(f"   Total size: {len(logs)} bytes")
     else:
-        print(logs)
+        # Write the bytes straight through; flush pending text output first
+        sys.stdout.flush()
+        sys.stdout.buffer.write(logs)
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.buffer.flush()
 
         # Print statistics
         print("\n" + "="*60)
         print(f"📊 Log statistics:")
-        print(f"   Total lines: {len(logs.split(chr(10)))}")
+        print(f"   Total lines: {count_lines(logs)}")
         print(f"   Total size: {len(logs)} bytes")
 
     return 0
@@ -551,33 +780,35 @@ def main():
     args = parse_args()
 
     try:
-        # Initialize configuration and client
+        # Initialize configuration and client. The auth probe runs in the
+        # background so it overlaps the project lookup instead of preceding it.
         print("🔐 Validating tokens...")
         config = GitLabConfig()
-        gl = config.get_gitlab_client()
-        print("✅ Tokens validated")
+        gl = config.create_gitlab_client()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            auth = executor.submit(config.validate_gitlab_client, gl)
+            try:
+                # Determine project identifier
+                if args.project and not args.auto:
+                    project = gl.projects.get(args.project)
+                else:
+                    print("🔍 Auto-resolving project from current directory...")
+                    resolver = ProjectResolver(gitlab_client=gl)
+                    project = resolver.resolve_project()
+            finally:
+                # A bad token also fails the lookup; surface the auth error first
+                auth.result()
 
-        # Determine project identifier
-        if args.auto:
-            print("🔍 Auto-resolving project...")
-            resolver = ProjectResolver(gitlab_client=gl)
-            project_id, project_name, project_path = resolver.resolve_from_repo()
-            project = gl.projects.get(project_id)
-            print(f"✅ Project: {project_name} (ID: {project.id})")
-        elif args.project:
-            project_identifier = args.project
-            project = gl.projects.get(project_identifier)
-            print(f"✅ Project: {project.name} (ID: {project.id})")
-        else:
-            # Try to auto-resolve
-            print("🔍 Auto-resolving project from current directory...")
-            resolver = ProjectResolver(gitlab_client=gl)
-            project_id, project_name, project_path = resolver.resolve_from_repo()
-            project = gl.projects.get(project_id)
-            print(f"✅ Project: {project_name} (ID: {project.id})")
-
-        # Initialize pipeline analyzer (needed for both modes)
-        analyzer = PipelineAnalyzer(gl, project.id) if args.batch or args.job_name else None
+        print("✅ Tokens validated")
+        print(f"✅ Project: {project.name} (ID: {project.id})")
+
+        # Initialize pipeline analyzer (batch mode and --job-name lookups)
+        analyzer = None
+        if args.batch or args.job_name:
+            # Imported lazily: pulls in pyyaml, unused by --job fast path
+            from pipeline_analyzer import PipelineAnalyzer
+            analyzer = PipelineAnalyzer(gl, project)
 
         # Route to appropriate handler
         if args.batch:
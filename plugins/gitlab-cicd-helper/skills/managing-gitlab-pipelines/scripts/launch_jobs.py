@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # dependencies = [
-#     "python-gitlab>=4.0.0",
+#     "python-gitlab>=4.5.0",
 #     "pyyaml>=6.0",
 # ]
 # ///
@@ -34,7 +34,9 @@ Examples:
 import sys
 import argparse
 import fnmatch
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add lib directory to path for imports
@@ -44,6 +46,9 @@ from gitlab_config import GitLabConfig
 from pipeline_analyzer import PipelineAnalyzer
 from project_resolver import ProjectResolver
 
+# Concurrent play requests in --batch mode (kept low for API rate limits)
+LAUNCH_PARALLELISM = 8
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -126,11 +131,11 @@ def parse_variables(var_list):
 
     variables = {}
     for var in var_list:
-        if '=' not in var:
+        key, sep, value = var.partition('=')
+        if not sep:
             print(f"⚠️  Warning: Ignoring invalid variable format: {var}")
             continue
 
-        key, value = var.split('=', 1)
         variables[key] = value
 
     return variables
@@ -139,6 +144,10 @@ def parse_variables(var_list):
 def launch_job(project, job_id, variables=None):
     """Launch a job using python-gitlab.
 
+    Plays a lazy job with a single request: no GET is needed first, and
+    play() loads the updated job from the response (python-gitlab 4.5+).
+    Failures surface as GitlabJobPlayError.
+
     Args:
         project: GitLab project object
         job_id: Job ID to launch
@@ -147,17 +156,15 @@ def launch_job(project, job_id, variables=None):
     Returns:
         Launched job object
     """
-    job = project.jobs.get(job_id)
-
-    # Prepare variables if provided
+    # Prepare variables if provided (sent in the JSON body)
+    post_data = None
     if variables:
-        job_variables = [{"key": k, "value": v} for k, v in variables.items()]
-        job.play(job_variables_attributes=job_variables)
-    else:
-        job.play()
+        post_data = {
+            "job_variables_attributes": [{"key": k, "value": v} for k, v in variables.items()]
+        }
 
-    # Refresh job to get updated status
-    job.refresh()
+    job = project.jobs.get(job_id, lazy=True)
+    job.play(post_data=post_data)
     return job
 
 
@@ -176,9 +183,8 @@ def main():
         if args.auto:
             print("🔍 Auto-resolving project...")
             resolver = ProjectResolver(gitlab_client=gl)
-            project_id, project_name, project_path = resolver.resolve_from_repo()
-            project = gl.projects.get(project_id)
-            print(f"✅ Project: {project_name} (ID: {project.id})")
+            project = resolver.resolve_project()
+            print(f"✅ Project: {project.name} (ID: {project.id})")
         elif args.project:
             project_identifier = args.project
             project = gl.projects.get(project_identifier)
@@ -187,12 +193,11 @@ def main():
             # Auto-resolve from current directory
             print("🔍 Auto-resolving project from current directory...")
             resolver = ProjectResolver(gitlab_client=gl)
-            project_id, project_name, project_path = resolver.resolve_from_repo()
-            project = gl.projects.get(project_id)
-            print(f"✅ Project: {project_name} (ID: {project.id})")
+            project = resolver.resolve_project()
+            print(f"✅ Project: {project.name} (ID: {project.id})")
 
         # Initialize pipeline analyzer
-        analyzer = PipelineAnalyzer(gl, project.id)
+        analyzer = PipelineAnalyzer(gl, project)
 
         # Parse variables
         variables = parse_variables(args.variables)
@@ -247,9 +252,10 @@ def main():
                 all_jobs = analyzer.get_all_jobs(args.pipeline)
                 all_jobs = [j for j in all_jobs if j.status == args.status]
 
-            # Apply pattern filter if specified
+            # Apply pattern filter if specified (glob compiled once)
             if args.pattern:
-                jobs = [j for j in all_jobs if fnmatch.fnmatch(j.name, args.pattern)]
+                name_match = re.compile(fnmatch.translate(args.pattern)).match
+                jobs = [j for j in all_jobs if name_match(j.name)]
             else:
                 jobs = all_jobs
 
@@ -257,7 +263,9 @@ def main():
                 print(f"⚠️  No {args.status} jobs found")
                 if args.pattern:
                     print(f"   (matching pattern: {args.pattern})")
-                print(f"\n   Total jobs in pipeline: {len(analyzer.get_all_jobs(args.pipeline))}")
+                # Counts only: reuses the cached full listing when there is one
+                status_counts, _ = analyzer.get_job_counts(args.pipeline)
+                print(f"\n   Total jobs in pipeline: {sum(status_counts.values())}")
                 return 0
 
             print(f"\n📋 Found {len(jobs)} jobs to launch:")
@@ -269,14 +277,22 @@ def main():
 
             launched = []
             failed = []
-            for job in jobs:
-                try:
-                    result = launch_job(project, job.id, variables)
-                    launched.append(result)
-                    print(f"   ✅ {job.name} [ID: {job.id}]")
-                except Exception as e:
-                    failed.append((job, str(e)))
-                    print(f"   ❌ {job.name} [ID: {job.id}]: {e}")
+            with ThreadPoolExecutor(max_workers=LAUNCH_PARALLELISM) as executor:
+                futures = {
+                    executor.submit(launch_job, project, job.id, variables): job
+                    for job in jobs
+                }
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        launched.append(future.result())
+                        print(f"   ✅ {job.name} [ID: {job.id}]")
+                    except Exception as e:
+                        failed.append((job, str(e)))
+                        print(f"   ❌ {job.name} [ID: {job.id}]: {e}")
+
+            # Launched jobs changed status; don't serve pre-launch job lists
+            analyzer.invalidate(args.pipeline)
 
             # Summary
             print(f"\n{'='*60}")
@@ -7,18 +7,48 @@
 """Batch log fetching with parallel processing and comprehensive reporting."""
 
 import concurrent.futures
+import gzip
+import heapq
 import json
+import os
 import re
+import shutil
+import sys
+import time
+from collections import defaultdict
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from threading import Lock
 from typing import Optional
 
+try:
+    import orjson  # Optional: C serializer for large manifests
+except ImportError:
+    orjson = None
+
+# Filename sanitizing: special characters → hyphen, then collapse hyphen runs
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-\.]')
+_HYPHEN_RUNS = re.compile(r'-+')
+
+# Job statuses that never produced a trace (job hasn't started)
+NO_TRACE_STATUSES = frozenset({
+    'created', 'pending', 'manual', 'scheduled', 'skipped',
+    'waiting_for_resource', 'preparing'
+})
+
+# gzip level for --compress: level 1 is fast and still shrinks CI logs a lot
+LOG_COMPRESSLEVEL = 1
+
+# Buffer size for concatenating per-job logs into aggregate.log
+AGGREGATE_COPY_CHUNK = 1024 * 1024
+
 
 class BatchLogFetcher:
     """Handles batch log retrieval with parallel processing and organized output."""
 
-    def __init__(self, gl_client, project_id: int, pipeline_id: int, output_dir: str):
+    def __init__(self, gl_client, project_id: int, pipeline_id: int, output_dir: str,
+                 compress: bool = False):
         """Initialize batch log fetcher.
 
         Args:
@@ -26,12 +56,16 @@ class BatchLogFetcher:
             project_id: GitLab project ID
             pipeline_id: Pipeline ID
             output_dir: Output directory for logs
+            compress: Write logs and aggregate.log gzip-compressed (.gz)
         """
         self.gl = gl_client
         self.project_id = project_id
         self.pipeline_id = pipeline_id
         self.output_dir = Path(output_dir)
-        self.project = gl_client.projects.get(project_id)
+        self.compress = compress
+        self.log_suffix = ".log.gz" if compress else ".log"
+        # Lazy: only the jobs manager is used, which needs just the ID
+        self.project = gl_client.projects.get(project_id, lazy=True)
 
     def sanitize_filename(self, name: str) -> str:
         """Sanitize job name for use in filenames.
@@ -43,13 +77,39 @@ class BatchLogFetcher:
             Sanitized filename
         """
         # Replace spaces and special characters with hyphens
-        sanitized = re.sub(r'[^\w\-\.]', '-', name)
+        sanitized = _UNSAFE_FILENAME_CHARS.sub('-', name)
         # Remove consecutive hyphens
-        sanitized = re.sub(r'-+', '-', sanitized)
+        sanitized = _HYPHEN_RUNS.sub('-', sanitized)
         # Remove leading/trailing hyphens
         sanitized = sanitized.strip('-')
         return sanitized
 
+    def log_filename(self, job_id: int, job_name: str) -> str:
+        """Build the log filename used for a job across all output folders.
+
+        Args:
+            job_id: Job ID
+            job_name: Job name
+
+        Returns:
+            Filename (e.g., 'job-123-build-backend.log')
+        """
+        return f"job-{job_id}-{self.sanitize_filename(job_name)}{self.log_suffix}"
+
+    def _open_log(self, path: Path, mode: str = 'wb'):
+        """Open a log file for binary I/O, through gzip with --compress.
+
+        Args:
+            path: Log file path
+            mode: 'wb' or 'rb'
+
+        Returns:
+            Binary file object
+        """
+        if self.compress:
+            return gzip.open(path, mode, compresslevel=LOG_COMPRESSLEVEL)
+        return open(path, mode)
+
     def create_directory_structure(self, jobs: list):
         """Create organized directory structure.
 
@@ -61,25 +121,31 @@ class BatchLogFetcher:
         (self.output_dir / "by-status").mkdir(exist_ok=True)
         (self.output_dir / "by-stage").mkdir(exist_ok=True)
 
-        # Create status subdirectories
-        statuses = set(job.status for job in jobs)
+        # Collect status and stage names in one pass over the jobs
+        statuses, stages = set(), set()
+        for job in jobs:
+            statuses.add(job.status)
+            stages.add(job.stage)
+
+        # Create status and stage subdirectories
         for status in statuses:
             (self.output_dir / "by-status" / status).mkdir(exist_ok=True)
-
-        # Create stage subdirectories
-        stages = set(job.stage for job in jobs)
         for stage in stages:
             (self.output_dir / "by-stage" / stage).mkdir(exist_ok=True)
 
     def fetch_single_log(self, job, filters: Optional[dict] = None) -> dict:
         """Fetch log for a single job.
 
+        The log is written to all/ from the worker thread, so disk writes
+        overlap the remaining fetches. Without filters the trace is streamed
+        straight to disk and never held in memory.
+
         Args:
             job: GitLab job object
-            filters: Optional filters (tail, grep, ignore_case, context)
+            filters: Optional filters (tail, grep, search, context)
 
         Returns:
-            Dictionary with job metadata and log content
+            Dictionary with job metadata and log_path
         """
         result = {
             "job_id": job.id,
@@ -87,7 +153,7 @@ class BatchLogFetcher:
             "status": job.status,
             "stage": job.stage,
             "duration": getattr(job, 'duration', None),
-            "logs": None,
+            "log_path": None,
             "log_lines": 0,
             "log_size_bytes": 0,
             "error": None,
@@ -95,67 +161,227 @@ class BatchLogFetcher:
         }
 
         try:
-            # Fetch full job object (list() returns partial without trace())
-            full_job = self.project.jobs.get(job.id)
-            logs = full_job.trace().decode('utf-8')
-
-            # Apply filters
-            if filters:
-                logs = self._apply_filters(logs, filters)
+            # Pipeline job listings lack trace(); a lazy project job has it
+            # without the extra GET for attributes we already hold
+            full_job = self.project.jobs.get(job.id, lazy=True)
+            log_path = self.output_dir / "all" / self.log_filename(job.id, job.name)
+
+            if not filters:
+                size, newlines = self._stream_trace(full_job, log_path)
+                if size:
+                    result["log_path"] = log_path
+                    result["log_lines"] = newlines + 1
+                    result["log_size_bytes"] = size
+                else:
+                    log_path.unlink()
+                return result
+
+            trace = full_job.trace()
+            if filters.get('tail'):
+                # Trim before decoding so only the kept lines are decoded
+                trace = self._tail(trace, filters['tail'])
 
-            result["logs"] = logs
-            result["log_lines"] = len(logs.split('\n')) if logs else 0
-            result["log_size_bytes"] = len(logs.encode('utf-8')) if logs else 0
+            if filters.get('grep'):
+                # Apply filters (grep needs text)
+                logs, result["error_matches"] = self._apply_filters(trace.decode('utf-8'), filters)
+                data = logs.encode('utf-8')
+            else:
+                # Tail only: the trimmed bytes are the result, no decoding
+                data = trace
 
-            # Count error matches if grep filter provided
-            if filters and filters.get('grep'):
-                pattern = filters['grep']
-                flags = re.IGNORECASE if filters.get('ignore_case') else 0
-                result["error_matches"] = len(re.findall(pattern, logs, flags=flags))
+            if data:
+                with self._open_log(log_path) as f:
+                    f.write(data)
+                result["log_path"] = log_path
+                result["log_lines"] = data.count(b'\n') + 1
+                result["log_size_bytes"] = len(data)
 
         except Exception as e:
             result["error"] = str(e)
 
         return result
 
-    def _apply_filters(self, logs: str, filters: dict) -> str:
+    def _stream_trace(self, job, path: Path) -> tuple[int, int]:
+        """Stream a job trace to disk chunk by chunk.
+
+        Args:
+            job: Full GitLab job object
+            path: Destination file
+
+        Returns:
+            Tuple of (uncompressed bytes written, newline count)
+        """
+        counts = [0, 0]
+
+        try:
+            with self._open_log(path) as f:
+                def write_chunk(chunk):
+                    f.write(chunk)
+                    counts[0] += len(chunk)
+                    counts[1] += chunk.count(b'\n')
+
+                job.trace(streamed=True, action=write_chunk, chunk_size=64 * 1024)
+        except Exception:
+            # Don't leave a truncated log behind
+            path.unlink(missing_ok=True)
+            raise
+
+        return counts[0], counts[1]
+
+    @staticmethod
+    def _tail(logs, count: int):
+        """Keep the last lines of a log without splitting all of it.
+
+        Args:
+            logs: Log content (str or bytes)
+            count: Number of lines to keep
+
+        Returns:
+            The last count lines (a trailing newline counts as an empty line)
+        """
+        newline = b'\n' if isinstance(logs, bytes) else '\n'
+        end = len(logs)
+        for _ in range(count):
+            end = logs.rfind(newline, 0, end)
+            if end < 0:
+                return logs
+        return logs[end + 1:]
+
+    @staticmethod
+    def _grep_lines(logs: str, search) -> list:
+        """Find lines matching a line matcher, walking the log line by line.
+
+        Each line is tested on its own, exactly like get_logs.py's single-job
+        grep, so every anchor refers to the line rather than the whole log.
+        Line bounds come from str.find, so the log is never split into a list.
+
+        Args:
+            logs: Log content
+            search: Callable taking a line and returning a truthy match
+
+        Returns:
+            List of (line_index, start, end) tuples in log order, where
+            logs[start:end] is the matching line
+        """
+        matches = []
+        find = logs.find
+        size = len(logs)
+        start = 0
+        line_index = 0
+
+        while start <= size:
+            end = find('\n', start)
+            if end < 0:
+                end = size
+            if search(logs[start:end]):
+                matches.append((line_index, start, end))
+            start = end + 1
+            line_index += 1
+
+        return matches
+
+    @staticmethod
+    def _context_windows(logs: str, matches: list, context: int) -> list:
+        """Slice matches plus surrounding lines out of the log.
+
+        Windows are found by walking newlines out from each match, so the
+        log is never split into a list of all its lines. Overlapping
+        windows are merged and every line is emitted once.
+
+        Args:
+            logs: Log content
+            matches: Output of _grep_lines()
+            context: Lines of context before and after each match
+
+        Returns:
+            List of log slices, one per window, each spanning whole lines
+        """
+        size = len(logs)
+        windows = []
+        last_line = -1
+        last_end = -1
+
+        for i, start, end in matches:
+            if i + context <= last_line:
+                # Already covered by the previous window
+                continue
+
+            if i - context > last_line:
+                # Walk back up to `context` lines from the match
+                first = start
+                for _ in range(context):
+                    if first == 0:
+                        break
+                    first = logs.rfind('\n', 0, first - 1) + 1
+            else:
+                # Continue right after the previous window
+                first = last_end + 1
+
+            # Walk forward up to `context` lines past the match
+            last_line = i
+            for _ in range(context):
+                if end >= size:
+                    break
+                following = logs.find('\n', end + 1)
+                end = size if following < 0 else following
+                last_line += 1
+
+            if windows and first == last_end + 1:
+                # Adjacent to the previous window: extend it
+                windows[-1] = (windows[-1][0], end)
+            else:
+                windows.append((first, end))
+            last_end = end
+
+        return [logs[start:end] for start, end in windows]
+
+    def _apply_filters(self, logs: str, filters: dict) -> tuple[str, int]:
         """Apply filters to log content.
 
         Args:
             logs: Raw log content
-            filters: Filters to apply (tail, grep, ignore_case, context)
+            filters: Filters to apply (tail, grep, context); grep also needs
+                     search, the line matcher built by get_logs.compile_grep()
 
         Returns:
-            Filtered log content
+            Tuple of (filtered log content, number of matching lines)
         """
         if not logs:
-            return logs
-
-        lines = logs.split('\n')
+            return logs, 0
 
         # Apply tail filter
         if filters.get('tail'):
-            lines = lines[-filters['tail']:]
+            logs = self._tail(logs, filters['tail'])
 
         # Apply grep filter
         if filters.get('grep'):
-            pattern = filters['grep']
-            flags = re.IGNORECASE if filters.get('ignore_case') else 0
+            matches = self._grep_lines(logs, filters['search'])
             context = filters.get('context', 0)
 
             if context > 0:
-                # Include context lines
-                matching_indices = set()
-                for i, line in enumerate(lines):
-                    if re.search(pattern, line, flags=flags):
-                        for j in range(max(0, i - context), min(len(lines), i + context + 1)):
-                            matching_indices.add(j)
-                lines = [lines[i] for i in sorted(matching_indices)]
-            else:
-                # Just matching lines
-                lines = [line for line in lines if re.search(pattern, line, flags=flags)]
+                return '\n'.join(self._context_windows(logs, matches, context)), len(matches)
+
+            # Just matching lines
+            return '\n'.join([logs[start:end] for _, start, end in matches]), len(matches)
 
-        return '\n'.join(lines)
+        return logs, 0
+
+    def _size_connection_pool(self, size: int):
+        """Size the client's HTTP connection pool for concurrent fetches.
+
+        All worker threads share python-gitlab's requests session; the default
+        pool keeps only 10 connections alive, so larger --parallel values would
+        otherwise reopen a TCP/TLS connection per request.
+
+        Args:
+            size: Number of concurrent fetches
+        """
+        # Keep the type and retry policy of the adapter being replaced
+        current = self.gl.session.get_adapter(f"{self.gl.url}/")
+        adapter = type(current)(pool_connections=size, pool_maxsize=size,
+                                max_retries=current.max_retries)
+        self.gl.session.mount("https://", adapter)
+        self.gl.session.mount("http://", adapter)
 
     def fetch_logs_batch(
         self,
@@ -170,91 +396,131 @@ class BatchLogFetcher:
             jobs: List of jobs to process
             parallel: Number of parallel fetches
             filters: Optional filters to apply to each log
-            skip_empty: Skip jobs with no logs
+            skip_empty: Skip jobs with no logs; jobs that never started
+                        aren't requested at all
 
         Returns:
             Dictionary with results and statistics
         """
+        total_jobs = len(jobs)
+        no_trace = 0
+        if skip_empty:
+            # The cheapest /trace request is the one never made
+            jobs = [job for job in jobs if job.status not in NO_TRACE_STATUSES]
+            no_trace = total_jobs - len(jobs)
+
+        start_time = datetime.utcnow()
+        started = time.monotonic()
         results = {
             "jobs": [],
             "statistics": {
-                "total_jobs": len(jobs),
+                "total_jobs": total_jobs,
                 "jobs_processed": 0,
-                "jobs_skipped": 0,
+                "jobs_skipped": no_trace,
+                "jobs_skipped_no_trace": no_trace,
                 "jobs_failed": 0,
                 "total_log_size_bytes": 0,
                 "total_lines": 0,
-                "processing_start": datetime.utcnow().isoformat(),
+                "processing_start": start_time.isoformat(),
                 "processing_end": None,
                 "processing_time_seconds": 0
             }
         }
 
-        start_time = datetime.utcnow()
+        self._size_connection_pool(parallel)
         lock = Lock()
         progress = {"completed": 0, "total": len(jobs)}
+        stats = results["statistics"]
 
         def fetch_with_progress(job):
             result = self.fetch_single_log(job, filters)
+            status_icon = "⚠️" if result["error"] else "✅"
+            size_str = f"{result['log_size_bytes'] / 1024 / 1024:.1f} MB" if result["log_size_bytes"] > 0 else "no logs"
+
             with lock:
                 progress["completed"] += 1
-                status_icon = "✅" if result["logs"] is not None and not result["error"] else "⚠️" if result["error"] else "⊘"
-                size_str = f"{result['log_size_bytes'] / 1024 / 1024:.1f} MB" if result["log_size_bytes"] > 0 else "no logs"
-                print(f"  {status_icon} [{progress['completed']}/{progress['total']}] {job.name} ({size_str})")
+                completed = progress["completed"]
+
+                # Tally statistics as each job lands (sizes were counted while streaming)
+                if skip_empty and result["error"]:
+                    stats["jobs_skipped"] += 1
+                else:
+                    if result["error"]:
+                        stats["jobs_failed"] += 1
+
+                    results["jobs"].append(result)
+                    stats["jobs_processed"] += 1
+                    stats["total_log_size_bytes"] += result["log_size_bytes"]
+                    stats["total_lines"] += result["log_lines"]
+
+            # Print outside the lock; a single write keeps lines whole
+            sys.stdout.write(f"  {status_icon} [{completed}/{progress['total']}] {job.name} ({size_str})\n")
             return result
 
         # Fetch logs in parallel
+        if no_trace:
+            print(f"\n⏭️  Skipping {no_trace} jobs that never started (no logs)")
         print(f"\n📥 Fetching logs for {len(jobs)} jobs (parallel: {parallel})...")
         with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
-            futures = [executor.submit(fetch_with_progress, job) for job in jobs]
-            job_results = [future.result() for future in concurrent.futures.as_completed(futures)]
-
-        # Process results
-        for result in job_results:
-            if skip_empty and result["logs"] is None:
-                results["statistics"]["jobs_skipped"] += 1
-                continue
-
-            if result["error"]:
-                results["statistics"]["jobs_failed"] += 1
-
-            results["jobs"].append(result)
-            results["statistics"]["jobs_processed"] += 1
-            results["statistics"]["total_log_size_bytes"] += result["log_size_bytes"]
-            results["statistics"]["total_lines"] += result["log_lines"]
-
-        # Calculate processing time
-        end_time = datetime.utcnow()
-        results["statistics"]["processing_end"] = end_time.isoformat()
-        results["statistics"]["processing_time_seconds"] = (end_time - start_time).total_seconds()
+            # Sliding window: keep workers busy without queueing a future per job
+            pending = set()
+            for job in jobs:
+                if len(pending) >= parallel * 2:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(fetch_with_progress, job))
+
+            for future in concurrent.futures.as_completed(pending):
+                future.result()
+
+        # Calculate processing time (monotonic clock; wall clock only for the timestamp)
+        results["statistics"]["processing_end"] = datetime.utcnow().isoformat()
+        results["statistics"]["processing_time_seconds"] = time.monotonic() - started
 
         return results
 
     def save_logs_to_files(self, results: dict):
         """Save logs to organized directory structure.
 
+        Logs were written to all/ during the fetch; by-status/ and by-stage/
+        get hard links to those files, so no log data is copied.
+
         Args:
             results: Results from fetch_logs_batch
         """
         for job_result in results["jobs"]:
-            if not job_result["logs"]:
+            if not job_result["log_size_bytes"]:
                 continue
 
-            job_id = job_result["job_id"]
-            job_name = self.sanitize_filename(job_result["job_name"])
             status = job_result["status"]
             stage = job_result["stage"]
 
-            filename = f"job-{job_id}-{job_name}.log"
-
-            # Save to all/
-            (self.output_dir / "all" / filename).write_text(job_result["logs"])
+            primary = job_result["log_path"]
+            filename = primary.name
 
             # Save to by-status/
-            (self.output_dir / "by-status" / status / filename).write_text(job_result["logs"])
+            self._link_or_copy(primary, self.output_dir / "by-status" / status / filename)
 
             # Save to by-stage/
-            (self.output_dir / "by-stage" / stage / filename).write_text(job_result["logs"])
+            self._link_or_copy(primary, self.output_dir / "by-stage" / stage / filename)
+
+    @staticmethod
+    def _link_or_copy(source: Path, dest: Path):
+        """Hard-link a log into place, copying where links aren't supported.
+
+        Args:
+            source: Log file in all/
+            dest: Destination path
+        """
+        # Replace logs left by an earlier run into the same directory
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(source, dest)
+        except OSError:
+            shutil.copyfile(source, dest)
 
     def create_aggregate_log(self, results: dict, project_name: str, branch: str) -> str:
         """Create single aggregated log file.
@@ -267,33 +533,40 @@ class BatchLogFetcher:
         Returns:
             Path to aggregate log file
         """
-        aggregate_path = self.output_dir / "aggregate.log"
+        aggregate_path = self.output_dir / f"aggregate{self.log_suffix}"
 
-        with open(aggregate_path, 'w') as f:
+        with self._open_log(aggregate_path) as f:
             # Header
-            f.write("=" * 80 + "\n")
-            f.write(f"Pipeline #{self.pipeline_id} - Batch Log Collection\n")
-            f.write(f"Project: {project_name}\n")
-            f.write(f"Branch: {branch}\n")
-            f.write(f"Collection Time: {results['statistics']['processing_start']}\n")
-            f.write(f"Total Jobs: {results['statistics']['jobs_processed']}\n")
-            f.write("=" * 80 + "\n\n")
-
-            # Individual job logs
+            f.write((
+                "=" * 80 + "\n"
+                f"Pipeline #{self.pipeline_id} - Batch Log Collection\n"
+                f"Project: {project_name}\n"
+                f"Branch: {branch}\n"
+                f"Collection Time: {results['statistics']['processing_start']}\n"
+                f"Total Jobs: {results['statistics']['jobs_processed']}\n"
+                + "=" * 80 + "\n\n"
+            ).encode('utf-8'))
+
+            # Individual job logs, copied file to file without decoding
             for job_result in results["jobs"]:
-                if not job_result["logs"]:
+                if not job_result["log_size_bytes"]:
                     continue
 
-                f.write("#" * 80 + "\n")
-                f.write(f"# Job: {job_result['job_name']} (ID: {job_result['job_id']})\n")
-                f.write(f"# Status: {job_result['status']}\n")
-                f.write(f"# Stage: {job_result['stage']}\n")
+                header = [
+                    "#" * 80,
+                    f"# Job: {job_result['job_name']} (ID: {job_result['job_id']})",
+                    f"# Status: {job_result['status']}",
+                    f"# Stage: {job_result['stage']}",
+                ]
                 if job_result['duration']:
-                    f.write(f"# Duration: {job_result['duration']}s\n")
-                f.write(f"# Log Lines: {job_result['log_lines']:,}\n")
-                f.write("#" * 80 + "\n")
-                f.write(job_result["logs"])
-                f.write("\n\n")
+                    header.append(f"# Duration: {job_result['duration']}s")
+                header.append(f"# Log Lines: {job_result['log_lines']:,}")
+                header.append("#" * 80 + "\n")
+                f.write("\n".join(header).encode('utf-8'))
+
+                with self._open_log(job_result["log_path"], 'rb') as src:
+                    shutil.copyfileobj(src, f, AGGREGATE_COPY_CHUNK)
+                f.write(b"\n\n")
 
         return str(aggregate_path)
 
@@ -350,15 +623,16 @@ class BatchLogFetcher:
             f.write(f"Total Lines: {stats['total_lines']:,}\n")
             f.write(f"Processing Time: {stats['processing_time_seconds']:.1f}s\n\n")
 
-            # Jobs by Status
-            status_breakdown = {}
+            # Count jobs and log sizes per status and per stage in one pass
+            status_breakdown = defaultdict(lambda: {"count": 0, "size": 0})
+            stage_breakdown = defaultdict(lambda: {"count": 0, "size": 0})
             for job in results["jobs"]:
-                status = job["status"]
-                if status not in status_breakdown:
-                    status_breakdown[status] = {"count": 0, "size": 0}
-                status_breakdown[status]["count"] += 1
-                status_breakdown[status]["size"] += job["log_size_bytes"]
+                size = job["log_size_bytes"]
+                for breakdown in (status_breakdown[job["status"]], stage_breakdown[job["stage"]]):
+                    breakdown["count"] += 1
+                    breakdown["size"] += size
 
+            # Jobs by Status
             if status_breakdown:
                 f.write("=" * 80 + "\n")
                 f.write("Jobs by Status\n")
@@ -369,14 +643,6 @@ class BatchLogFetcher:
                 f.write("\n")
 
             # Jobs by Stage
-            stage_breakdown = {}
-            for job in results["jobs"]:
-                stage = job["stage"]
-                if stage not in stage_breakdown:
-                    stage_breakdown[stage] = {"count": 0, "size": 0}
-                stage_breakdown[stage]["count"] += 1
-                stage_breakdown[stage]["size"] += job["log_size_bytes"]
-
             if stage_breakdown:
                 f.write("=" * 80 + "\n")
                 f.write("Jobs by Stage\n")
@@ -393,7 +659,7 @@ class BatchLogFetcher:
                     f.write("=" * 80 + "\n")
                     f.write(f"Error Analysis (pattern: {filters['grep']})\n")
                     f.write("=" * 80 + "\n")
-                    for job in sorted(jobs_with_errors, key=lambda x: x["error_matches"], reverse=True)[:10]:
+                    for job in heapq.nlargest(10, jobs_with_errors, key=itemgetter("error_matches")):
                         f.write(f"\nJob: {job['job_name']} (ID: {job['job_id']})\n")
                         f.write(f"  Error matches: {job['error_matches']} lines\n")
                     f.write("\n")
@@ -402,10 +668,10 @@ class BatchLogFetcher:
             f.write("=" * 80 + "\n")
             f.write("Top 10 Largest Logs\n")
             f.write("=" * 80 + "\n")
-            sorted_jobs = sorted(results["jobs"], key=lambda x: x["log_size_bytes"], reverse=True)[:10]
+            sorted_jobs = heapq.nlargest(10, results["jobs"], key=itemgetter("log_size_bytes"))
             for i, job in enumerate(sorted_jobs, 1):
                 size_mb = job["log_size_bytes"] / 1024 / 1024
-                filename = f"job-{job['job_id']}-{self.sanitize_filename(job['job_name'])}.log"
+                filename = self.log_filename(job['job_id'], job['job_name'])
                 f.write(f"{i:2}. {filename:50} {size_mb:6.1f} MB  ({job['log_lines']:,} lines)\n")
             f.write("\n")
 
@@ -424,9 +690,14 @@ class BatchLogFetcher:
             f.write(f"cd {self.output_dir}/by-status && ls -lh\n")
             f.write(f"cd {self.output_dir}/by-stage && ls -lh\n\n")
             f.write(f"# Search across all logs\n")
-            f.write(f"grep -r 'ERROR' {self.output_dir}/all/\n\n")
-            f.write(f"# View aggregate log\n")
-            f.write(f"less {self.output_dir}/aggregate.log\n\n")
+            if self.compress:
+                f.write(f"zgrep 'ERROR' {self.output_dir}/all/*.gz\n\n")
+                f.write(f"# View aggregate log\n")
+                f.write(f"zless {self.output_dir}/aggregate.log.gz\n\n")
+            else:
+                f.write(f"grep -r 'ERROR' {self.output_dir}/all/\n\n")
+                f.write(f"# View aggregate log\n")
+                f.write(f"less {self.output_dir}/aggregate.log\n\n")
 
         return str(summary_path)
 
@@ -449,24 +720,39 @@ class BatchLogFetcher:
             "collection_time": results["statistics"]["processing_start"],
             "output_dir": str(self.output_dir),
             "filters": filters,
-            "statistics": results["statistics"],
-            "jobs": [
-                {
-                    "job_id": j["job_id"],
-                    "job_name": j["job_name"],
-                    "status": j["status"],
-                    "stage": j["stage"],
-                    "duration": j["duration"],
-                    "log_file": f"all/job-{j['job_id']}-{self.sanitize_filename(j['job_name'])}.log",
-                    "log_size_bytes": j["log_size_bytes"],
-                    "log_lines": j["log_lines"],
-                    "error_matches": j["error_matches"]
-                }
-                for j in results["jobs"]
-            ]
+            "statistics": results["statistics"]
         }
+        jobs = (
+            {
+                "job_id": j["job_id"],
+                "job_name": j["job_name"],
+                "status": j["status"],
+                "stage": j["stage"],
+                "duration": j["duration"],
+                "log_file": f"all/{self.log_filename(j['job_id'], j['job_name'])}",
+                "log_size_bytes": j["log_size_bytes"],
+                "log_lines": j["log_lines"],
+                "error_matches": j["error_matches"]
+            }
+            for j in results["jobs"]
+        )
+
+        if orjson is not None:
+            manifest["jobs"] = list(jobs)
+            manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+            return str(manifest_path)
 
+        # Stream the job entries one at a time after the header fields;
+        # the output is identical to json.dumps(manifest, indent=2)
         with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+            f.write(json.dumps(manifest, indent=2)[:-2])
+            f.write(',\n  "jobs": [')
+            count = 0
+            for entry in jobs:
+                # Encoded strings never contain raw newlines, so re-indenting is safe
+                f.write((',' if count else '') + '\n    ')
+                f.write(json.dumps(entry, indent=2).replace('\n', '\n    '))
+                count += 1
+            f.write('\n  ]\n}' if count else ']\n}')
 
         return str(manifest_path)
@@ -7,26 +7,133 @@
 # ///
 """Pipeline structure analysis and state management."""
 
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
 import yaml
+from pathlib import Path
 from typing import Optional
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
 import gitlab
 from gitlab.v4.objects import Project, ProjectPipeline
 
+# LibYAML C loader when PyYAML was built with it; merged configs can be large
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Largest page size GitLab accepts; fewer round-trips for big pipelines
+JOBS_PER_PAGE = 100
+
+# Pipelines summarized at once by get_pipeline_summaries (I/O bound)
+SUMMARY_PARALLELISM = 8
+
+# Expanded CI configs cached on disk per commit; content never changes for
+# a given SHA, so entries only age out
+CI_CONFIG_CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+@lru_cache(maxsize=32)
+def _glob_matcher(pattern: str):
+    """Compile a glob-style job name pattern into a regex match function.
+
+    Watch mode checks the same pattern every refresh, so the translation
+    happens once per pattern for the life of the process.
+    """
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+# Job status/stage for a pipeline, one page of GitLab's GraphQL API.
+# Retried jobs are excluded to match the REST job listing.
+JOB_COUNTS_QUERY = """
+query($path: ID!, $pipeline: CiPipelineID!, $after: String) {
+  project(fullPath: $path) {
+    pipeline(id: $pipeline) {
+      jobs(first: 100, after: $after, retried: false) {
+        pageInfo { hasNextPage endCursor }
+        nodes { status stage { name } }
+      }
+    }
+  }
+}
+"""
+
+
+def _ci_config_cache_path(project_id, key: str) -> Path:
+    """Location of a cached expanded CI config (XDG cache dir)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+    return (Path(cache_home).expanduser() / "gitlab-cicd-helper" / "ci-configs"
+            / f"{project_id}-{key}.json")
+
 
 class PipelineAnalyzer:
     """Provides holistic pipeline awareness and state management."""
 
-    def __init__(self, gl_client: gitlab.Gitlab, project_id: str):
+    def __init__(self, gl_client: gitlab.Gitlab, project_id):
         """Initialize pipeline analyzer.
 
         Args:
             gl_client: Authenticated python-gitlab client
-            project_id: Project ID or path (e.g., "1603" or "group/project")
+            project_id: Project ID or path (e.g., "1603" or "group/project"),
+                        or an already fetched Project object
         """
         self.gl = gl_client
-        self.project = self.gl.projects.get(project_id)
+        if isinstance(project_id, Project):
+            self.project = project_id
+        else:
+            self.project = self.gl.projects.get(project_id)
         self._config_cache = {}
+        self._request_cache = {}
+        self._inflight_locks = {}
+        self._cache_lock = Lock()
+
+    def _cached(self, key: tuple, fetch):
+        """Return a cached API result, fetching it on first use.
+
+        Single-flight: when several threads ask for the same key at once,
+        only one performs the request and the others wait for its result.
+
+        Args:
+            key: Cache key, (resource_type, id, ...)
+            fetch: Callable performing the API request
+
+        Returns:
+            Cached or freshly fetched result
+        """
+        if key in self._request_cache:
+            return self._request_cache[key]
+
+        with self._cache_lock:
+            key_lock = self._inflight_locks.setdefault(key, Lock())
+
+        with key_lock:
+            if key in self._request_cache:
+                return self._request_cache[key]
+            result = fetch()
+            self._request_cache[key] = result
+            return result
+
+    def clear_cache(self) -> None:
+        """Clear cached pipeline and job data (call before re-polling)."""
+        with self._cache_lock:
+            self._request_cache.clear()
+            self._inflight_locks.clear()
+
+    def invalidate(self, pipeline_id: int) -> None:
+        """Drop cached data for one pipeline (e.g. after launching its jobs).
+
+        Args:
+            pipeline_id: Pipeline ID
+        """
+        with self._cache_lock:
+            for key in [key for key in self._request_cache if key[1] == pipeline_id]:
+                del self._request_cache[key]
+                self._inflight_locks.pop(key, None)
 
     def get_pipeline(self, pipeline_id: int) -> ProjectPipeline:
         """Get pipeline object.
@@ -37,12 +144,18 @@ class PipelineAnalyzer:
         Returns:
             Pipeline object
         """
-        return self.project.pipelines.get(pipeline_id)
+        return self._cached(
+            ('pipeline', pipeline_id),
+            lambda: self.project.pipelines.get(pipeline_id)
+        )
 
     def get_all_jobs(self, pipeline_id: int, scope: Optional[list[str]] = None) -> list:
         """Get ALL jobs in a pipeline with proper pagination.
 
-        This is the KEY method that fixes the pagination bug.
+        This is the KEY method that fixes the pagination bug. Pages are
+        requested at the maximum size, and results are cached per
+        (pipeline, scope) until clear_cache() is called. Scoped queries
+        are served from the cached full list when it is available.
 
         Args:
             pipeline_id: Pipeline ID
@@ -56,17 +169,27 @@ class PipelineAnalyzer:
             # Get all manual jobs (not just first 20!)
             manual_jobs = analyzer.get_all_jobs(pipeline_id, scope=['manual'])
         """
-        pipeline = self.get_pipeline(pipeline_id)
+        all_key = ('jobs', pipeline_id, None)
+        if scope and all_key in self._request_cache:
+            # Already holding the full job list: filter locally, no request
+            statuses = set(scope)
+            return [job for job in self._request_cache[all_key] if job.status in statuses]
+
+        def fetch():
+            # Lazy handle: listing jobs doesn't need the pipeline's own
+            # attributes, so skip the extra GET (and allow it to run concurrently)
+            pipeline = self.project.pipelines.get(pipeline_id, lazy=True)
+
+            if scope:
+                # python-gitlab API: scope parameter filters jobs
+                # get_all=True ensures ALL pages are fetched
+                return pipeline.jobs.list(scope=scope, get_all=True, per_page=JOBS_PER_PAGE)
 
-        if scope:
-            # python-gitlab API: scope parameter filters jobs
-            # get_all=True ensures ALL pages are fetched
-            jobs = pipeline.jobs.list(scope=scope, get_all=True)
-        else:
             # Get ALL jobs regardless of status
-            jobs = pipeline.jobs.list(get_all=True)
+            return pipeline.jobs.list(get_all=True, per_page=JOBS_PER_PAGE)
 
-        return jobs
+        key = ('jobs', pipeline_id, tuple(scope) if scope else None)
+        return list(self._cached(key, fetch))
 
     def get_jobs_by_status(self, pipeline_id: int) -> dict[str, list]:
         """Get jobs grouped by status.
@@ -80,11 +203,11 @@ class PipelineAnalyzer:
         """
         all_jobs = self.get_all_jobs(pipeline_id)
 
-        jobs_by_status = defaultdict(list)
+        jobs_by_status: dict[str, list] = {}
         for job in all_jobs:
-            jobs_by_status[job.status].append(job)
+            jobs_by_status.setdefault(job.status, []).append(job)
 
-        return dict(jobs_by_status)
+        return jobs_by_status
 
     def get_jobs_by_stage(self, pipeline_id: int) -> dict[str, list]:
         """Get jobs grouped by stage.
@@ -97,11 +220,11 @@ class PipelineAnalyzer:
         """
         all_jobs = self.get_all_jobs(pipeline_id)
 
-        jobs_by_stage = defaultdict(list)
+        jobs_by_stage: dict[str, list] = {}
         for job in all_jobs:
-            jobs_by_stage[job.stage].append(job)
+            jobs_by_stage.setdefault(job.stage, []).append(job)
 
-        return dict(jobs_by_stage)
+        return jobs_by_stage
 
     def get_executable_jobs(self, pipeline_id: int) -> dict[str, list]:
         """Get jobs that can be executed now.
@@ -137,9 +260,15 @@ class PipelineAnalyzer:
         Returns:
             List of matching jobs (empty list if not found)
         """
-        all_jobs = self.get_all_jobs(pipeline_id)
-        matching_jobs = [job for job in all_jobs if job.name == job_name]
-        return matching_jobs
+        def build_index():
+            index: dict[str, list] = {}
+            for job in self.get_all_jobs(pipeline_id):
+                index.setdefault(job.name, []).append(job)
+            return index
+
+        # Name → jobs index, built once per pipeline listing
+        index = self._cached(('name_index', pipeline_id), build_index)
+        return list(index.get(job_name, []))
 
     def find_jobs_by_pattern(self, pipeline_id: int, pattern: str) -> list:
         """Find jobs matching a name pattern (glob-style).
@@ -151,12 +280,72 @@ class PipelineAnalyzer:
         Returns:
             List of matching jobs
         """
-        import fnmatch
-
+        name_match = _glob_matcher(pattern)
         all_jobs = self.get_all_jobs(pipeline_id)
-        matching_jobs = [job for job in all_jobs if fnmatch.fnmatch(job.name, pattern)]
+        matching_jobs = [job for job in all_jobs if name_match(job.name)]
         return matching_jobs
 
+    def get_job_counts(self, pipeline_id: int) -> tuple[Counter, Counter]:
+        """Count a pipeline's jobs per status and per stage.
+
+        Reuses the cached job list when one is held; otherwise only the two
+        fields needed are requested through GraphQL instead of listing full
+        job objects. Falls back to the REST job list if GraphQL fails.
+
+        Args:
+            pipeline_id: Pipeline ID
+
+        Returns:
+            Tuple of (status_counts, stage_counts); stage counts keep
+            first-seen order
+        """
+        all_key = ('jobs', pipeline_id, None)
+        if all_key not in self._request_cache:
+            try:
+                return self._cached(
+                    ('job_counts', pipeline_id),
+                    lambda: self._fetch_job_counts_graphql(pipeline_id)
+                )
+            except (gitlab.GitlabError, KeyError, TypeError, AttributeError):
+                pass
+
+        all_jobs = self.get_all_jobs(pipeline_id)
+        return (Counter(job.status for job in all_jobs),
+                Counter(job.stage for job in all_jobs))
+
+    def _fetch_job_counts_graphql(self, pipeline_id: int) -> tuple[Counter, Counter]:
+        """Count jobs per status and stage through GitLab's GraphQL API.
+
+        Args:
+            pipeline_id: Pipeline ID
+
+        Returns:
+            Tuple of (status_counts, stage_counts)
+        """
+        status_counts = Counter()
+        stage_counts = Counter()
+        variables = {
+            "path": self.project.path_with_namespace,
+            "pipeline": f"gid://gitlab/Ci::Pipeline/{pipeline_id}",
+            "after": None
+        }
+
+        while True:
+            response = self.gl.http_post(
+                f"{self.gl.url}/api/graphql",
+                post_data={"query": JOB_COUNTS_QUERY, "variables": variables}
+            )
+            jobs = response["data"]["project"]["pipeline"]["jobs"]
+            for node in jobs["nodes"]:
+                # GraphQL enums are upper case (SUCCESS); REST uses 'success'
+                status_counts[node["status"].lower()] += 1
+                stage_counts[(node["stage"] or {}).get("name") or 'unknown'] += 1
+
+            page_info = jobs["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return status_counts, stage_counts
+            variables["after"] = page_info["endCursor"]
+
     def get_pipeline_summary(self, pipeline_id: int) -> dict:
         """Get comprehensive pipeline summary.
 
@@ -176,19 +365,14 @@ class PipelineAnalyzer:
                 'stages': [...]
             }
         """
-        pipeline = self.get_pipeline(pipeline_id)
-        all_jobs = self.get_all_jobs(pipeline_id)
-        jobs_by_status = self.get_jobs_by_status(pipeline_id)
-        jobs_by_stage = self.get_jobs_by_stage(pipeline_id)
+        # Pipeline details and job counts are independent requests; overlap them
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            counts_future = executor.submit(self.get_job_counts, pipeline_id)
+            pipeline = self.get_pipeline(pipeline_id)
+            status_counts, stage_counts = counts_future.result()
 
-        # Count jobs per status
-        status_counts = {status: len(jobs) for status, jobs in jobs_by_status.items()}
-
-        # Count jobs per stage
-        stage_counts = {stage: len(jobs) for stage, jobs in jobs_by_stage.items()}
-
-        # Get stage names in order
-        stages = list(jobs_by_stage.keys())
+        # Get stage names in order (Counter keeps first-seen order)
+        stages = list(stage_counts)
 
         return {
             'pipeline_id': pipeline.id,
@@ -197,12 +381,30 @@ class PipelineAnalyzer:
             'created_at': pipeline.created_at,
             'updated_at': pipeline.updated_at,
             'web_url': pipeline.web_url,
-            'total_jobs': len(all_jobs),
-            'jobs_by_status': status_counts,
-            'jobs_by_stage': stage_counts,
+            'total_jobs': sum(status_counts.values()),
+            'jobs_by_status': dict(status_counts),
+            'jobs_by_stage': dict(stage_counts),
             'stages': stages
         }
 
+    def get_pipeline_summaries(self, pipeline_ids: list[int]) -> dict[int, dict]:
+        """Get summaries for several pipelines concurrently.
+
+        Args:
+            pipeline_ids: Pipeline IDs
+
+        Returns:
+            Dictionary mapping pipeline ID to its get_pipeline_summary() result
+        """
+        pipeline_ids = list(dict.fromkeys(pipeline_ids))
+        if not pipeline_ids:
+            return {}
+
+        workers = min(SUMMARY_PARALLELISM, len(pipeline_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            summaries = executor.map(self.get_pipeline_summary, pipeline_ids)
+            return dict(zip(pipeline_ids, summaries))
+
     def display_pipeline_summary(self, pipeline_id: int) -> None:
         """Display formatted pipeline summary.
 
@@ -231,7 +433,7 @@ class PipelineAnalyzer:
 
         print(f"{'='*60}\n")
 
-    def parse_gitlab_ci_config(self, ref: str = 'main') -> Optional[dict]:
+    def parse_gitlab_ci_config(self, ref: str = 'main', sha: Optional[str] = None) -> Optional[dict]:
         """Parse .gitlab-ci.yml configuration.
 
         Note: This uses GitLab's CI Lint API to get the fully expanded configuration
@@ -239,20 +441,43 @@ class PipelineAnalyzer:
 
         Args:
             ref: Branch/tag reference to get config from
+            sha: Optional commit SHA (e.g. pipeline.sha). When given, the file
+                 is read at that commit and a cached result for it skips
+                 all requests.
+
+        Expanded configs are also cached on disk by (ref, file content), so
+        an unchanged .gitlab-ci.yml skips the slow CI Lint call across runs.
 
         Returns:
             Parsed configuration dictionary or None if parsing fails
         """
         # Check cache first
-        cache_key = f"{self.project.id}:{ref}"
+        cache_key = f"{self.project.id}:{sha or ref}"
         if cache_key in self._config_cache:
             return self._config_cache[cache_key]
 
+        if sha:
+            config = self._load_cached_ci_config(sha)
+            if config is not None:
+                self._config_cache[cache_key] = config
+                return config
+
         try:
             # Get .gitlab-ci.yml content
-            ci_file = self.project.files.get(file_path='.gitlab-ci.yml', ref=ref)
+            ci_file = self.project.files.get(file_path='.gitlab-ci.yml', ref=sha or ref)
             ci_content = ci_file.decode().decode('utf-8')
 
+            # Lint output depends on the content and the ref it's evaluated for
+            content_key = "content-" + hashlib.sha256(
+                f"{ref}\0{ci_content}".encode('utf-8')
+            ).hexdigest()
+            config = self._load_cached_ci_config(content_key)
+            if config is not None:
+                self._config_cache[cache_key] = config
+                if sha:
+                    self._save_cached_ci_config(sha, config)
+                return config
+
             # Use GitLab CI Lint API to get fully expanded configuration
             # This resolves all includes, variables, extends, anchors, etc.
             lint_result = self.project.ci_lint.create({
@@ -263,8 +488,11 @@ class PipelineAnalyzer:
 
             if lint_result.valid:
                 # Parse the merged YAML
-                config = yaml.safe_load(lint_result.merged_yaml)
+                config = yaml.load(lint_result.merged_yaml, Loader=_YamlLoader)
                 self._config_cache[cache_key] = config
+                self._save_cached_ci_config(content_key, config)
+                if sha:
+                    self._save_cached_ci_config(sha, config)
                 return config
             else:
                 print(f"⚠️  Warning: .gitlab-ci.yml validation failed:")
@@ -279,6 +507,42 @@ class PipelineAnalyzer:
             print(f"⚠️  Warning: Error parsing .gitlab-ci.yml: {e}")
             return None
 
+    def _load_cached_ci_config(self, key: str) -> Optional[dict]:
+        """Load an expanded CI config saved by an earlier run.
+
+        Args:
+            key: Commit SHA or content hash the config was cached under
+
+        Returns:
+            Configuration dictionary, or None if missing or expired
+        """
+        path = _ci_config_cache_path(self.project.id, key)
+        try:
+            if time.time() - path.stat().st_mtime > CI_CONFIG_CACHE_MAX_AGE:
+                return None
+            with open(path) as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_ci_config(self, key: str, config: dict) -> None:
+        """Persist an expanded CI config (best effort, written atomically).
+
+        Args:
+            key: Commit SHA or content hash to cache under
+            config: Configuration dictionary
+        """
+        path = _ci_config_cache_path(self.project.id, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(config, f, default=str)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            pass
+
     def get_job_config(self, job_name: str, ref: str = 'main') -> Optional[dict]:
         """Get job configuration from .gitlab-ci.yml.
 
@@ -1,10 +1,73 @@
 """Auto-resolve GitLab project IDs from git remotes."""
 
+import configparser
+import json
+import os
 import subprocess
 import re
+import tempfile
 from pathlib import Path
 from typing import Optional, Tuple
 
+# Git remote URL formats (a trailing .git is excluded from the captured path)
+_HTTPS_REMOTE_RE = re.compile(r'https://[^/]+/(.+?)(?:\.git)?$')
+_SSH_REMOTE_RE = re.compile(r'git@[^:]+:(.+?)(?:\.git)?$')
+
+
+def _read_origin_url(repo_path: str) -> Optional[str]:
+    """Read the origin remote URL straight from the repository's git config.
+
+    Avoids spawning git for the common case. Returns None whenever git
+    itself should answer: no repository found, an unparseable config, or
+    repo-local config that changes how URLs resolve (url.*.insteadOf,
+    includes). Rewrites from global/system config aren't seen here, so
+    callers must still hand URLs they can't parse to git.
+
+    Args:
+        repo_path: Path inside a git repository
+
+    Returns:
+        Remote URL, or None to fall back to `git remote get-url`
+    """
+    start = Path(repo_path).resolve()
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.exists():
+            break
+    else:
+        return None
+
+    try:
+        if dot_git.is_file():
+            # Worktree or submodule: .git holds a "gitdir: <path>" pointer
+            pointer = dot_git.read_text().strip()
+            if not pointer.startswith("gitdir:"):
+                return None
+            git_dir = (directory / pointer[len("gitdir:"):].strip()).resolve()
+            commondir = git_dir / "commondir"
+            if commondir.exists():
+                git_dir = (git_dir / commondir.read_text().strip()).resolve()
+        else:
+            git_dir = dot_git
+
+        config = configparser.ConfigParser(strict=False, interpolation=None)
+        if not config.read(git_dir / "config"):
+            return None
+    except (OSError, configparser.Error):
+        return None
+
+    for section in config.sections():
+        if section.startswith(("url ", "include")):
+            return None
+
+    return config.get('remote "origin"', "url", fallback=None)
+
+
+def _disk_cache_path() -> Path:
+    """Location of the persistent resolution cache (XDG cache dir)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+    return Path(cache_home).expanduser() / "gitlab-cicd-helper" / "projects.json"
+
 
 class ProjectResolver:
     """Resolve GitLab project IDs from git remotes or project paths."""
@@ -19,6 +82,8 @@ class ProjectResolver:
         self.gitlab_client = gitlab_client
         self.gitlab_url = gitlab_url
         self._cache = {}
+        self._projects = {}
+        self._disk_cache = self._load_disk_cache()
 
     def resolve_from_repo(self, repo_path: Optional[str] = None) -> Tuple[int, str, str]:
         """Resolve project ID from git repository using GitLab API.
@@ -40,13 +105,18 @@ class ProjectResolver:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        # Get git remote URL
+        # Get git remote URL from .git/config directly. Anything that isn't a
+        # plain HTTPS/SSH URL may be an alias rewritten by url.*.insteadOf in
+        # global/system config, so let git resolve those.
+        remote_url = _read_origin_url(repo_path)
         try:
-            remote_url = subprocess.check_output(
-                ["git", "-C", repo_path, "remote", "get-url", "origin"],
-                text=True,
-                stderr=subprocess.PIPE
-            ).strip()
+            if not remote_url or not (_HTTPS_REMOTE_RE.match(remote_url)
+                                      or _SSH_REMOTE_RE.match(remote_url)):
+                remote_url = subprocess.check_output(
+                    ["git", "-C", repo_path, "remote", "get-url", "origin"],
+                    text=True,
+                    stderr=subprocess.PIPE
+                ).strip()
         except subprocess.CalledProcessError as e:
             raise ValueError(
                 f"❌ Failed to get git remote URL\n"
@@ -62,6 +132,16 @@ class ProjectResolver:
 
         # If we have a GitLab client, resolve to numeric project ID
         if self.gitlab_client:
+            # Keyed by instance, checkout and remote path, so a re-pointed
+            # remote misses (the raw URL may embed credentials; never stored)
+            disk_key = f"{self.gitlab_client.url}|{cache_key}|{project_path}"
+            if disk_key in self._disk_cache:
+                result = tuple(self._disk_cache[disk_key])
+                print(f"✅ Resolved to project ID: {result[0]} (cached)")
+
+                self._cache[cache_key] = result
+                return result
+
             try:
                 # First try direct path lookup (python-gitlab handles encoding internally)
                 project = self.gitlab_client.projects.get(project_path)
@@ -70,10 +150,25 @@ class ProjectResolver:
                 print(f"✅ Resolved to project ID: {project.id}")
 
                 self._cache[cache_key] = result
+                self._projects[project.id] = project
+                self._save_disk_cache(disk_key, result)
                 return result
 
             except Exception as path_error:
-                # Fallback: Search for project by name (enhancement for restricted tokens)
+                # Fallback 1: exact GraphQL lookup by full path (single small request)
+                try:
+                    result = self._lookup_graphql(project_path)
+                except Exception:
+                    result = None
+
+                if result:
+                    print(f"✅ Resolved via GraphQL to project ID: {result[0]}")
+
+                    self._cache[cache_key] = result
+                    self._save_disk_cache(disk_key, result)
+                    return result
+
+                # Fallback 2: Search for project by name (enhancement for restricted tokens)
                 try:
                     print(f"   Direct lookup failed, searching by project name...")
                     projects = self.gitlab_client.projects.list(
@@ -88,6 +183,8 @@ class ProjectResolver:
                             print(f"✅ Resolved via search to project ID: {proj.id}")
 
                             self._cache[cache_key] = result
+                            self._projects[proj.id] = proj
+                            self._save_disk_cache(disk_key, result)
                             return result
 
                     raise ValueError(f"Project not found in search results")
@@ -106,6 +203,63 @@ class ProjectResolver:
             self._cache[cache_key] = result
             return result
 
+    def _lookup_graphql(self, project_path: str) -> Optional[Tuple[int, str, str]]:
+        """Look up a project by full path through GitLab's GraphQL API.
+
+        Args:
+            project_path: Full project path (e.g., 'group/subgroup/project')
+
+        Returns:
+            Tuple of (project_id, project_name, project_path), or None if
+            the project isn't visible
+        """
+        response = self.gitlab_client.http_post(
+            f"{self.gitlab_client.url}/api/graphql",
+            post_data={
+                "query": "query($path: ID!) { project(fullPath: $path) { id name fullPath } }",
+                "variables": {"path": project_path}
+            }
+        )
+        project = (response.get("data") or {}).get("project")
+        if not project:
+            return None
+
+        # Global ID format: gid://gitlab/Project/<numeric id>
+        project_id = int(project["id"].rsplit("/", 1)[-1])
+        return (project_id, project["name"], project["fullPath"])
+
+    def resolve_project(self, repo_path: Optional[str] = None):
+        """Resolve the git repository to a GitLab project object.
+
+        Reuses the project fetched during resolution instead of requesting
+        it again by ID. Resolutions served from the on-disk cache come back
+        as a lazy project carrying id, name and path_with_namespace, so no
+        request is made at all; other attributes are not loaded.
+
+        Args:
+            repo_path: Path to git repository (defaults to current directory)
+
+        Returns:
+            python-gitlab Project object
+
+        Raises:
+            ValueError: If git remote not found or no GitLab client configured
+            RuntimeError: If GitLab API lookup fails
+        """
+        if not self.gitlab_client:
+            raise ValueError("❌ A GitLab client is required to resolve project objects")
+
+        project_id, project_name, project_path = self.resolve_from_repo(repo_path)
+        if project_id not in self._projects:
+            from gitlab.v4.objects import Project
+
+            self._projects[project_id] = Project(
+                self.gitlab_client.projects,
+                {"id": project_id, "name": project_name, "path_with_namespace": project_path},
+                lazy=True
+            )
+        return self._projects[project_id]
+
     def _parse_git_remote_url(self, remote_url: str) -> str:
         """Parse project path from git remote URL.
 
@@ -119,14 +273,14 @@ class ProjectResolver:
             ValueError: If URL format is not recognized
         """
         # HTTPS format: https://gitlab.example.com/group/subgroup/project.git
-        https_match = re.match(r'https://[^/]+/(.+?)(?:\.git)?$', remote_url)
+        https_match = _HTTPS_REMOTE_RE.match(remote_url)
         if https_match:
-            return https_match.group(1).rstrip('.git')
+            return https_match.group(1)
 
         # SSH format: git@gitlab.example.com:group/subgroup/project.git
-        ssh_match = re.match(r'git@[^:]+:(.+?)(?:\.git)?$', remote_url)
+        ssh_match = _SSH_REMOTE_RE.match(remote_url)
         if ssh_match:
-            return ssh_match.group(1).rstrip('.git')
+            return ssh_match.group(1)
 
         raise ValueError(
             f"❌ Unrecognized git remote URL format: {remote_url}\n"
@@ -134,5 +288,39 @@ class ProjectResolver:
         )
 
     def clear_cache(self) -> None:
-        """Clear the resolution cache."""
+        """Clear the resolution cache, including the on-disk copy."""
         self._cache.clear()
+        self._projects.clear()
+        self._disk_cache.clear()
+        _disk_cache_path().unlink(missing_ok=True)
+
+    def _load_disk_cache(self) -> dict:
+        """Load persisted resolutions from earlier runs.
+
+        Returns:
+            Mapping of cache key to [project_id, project_name, project_path]
+        """
+        try:
+            with open(_disk_cache_path()) as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_disk_cache(self, key: str, result: Tuple[int, str, str]) -> None:
+        """Persist a resolution (best effort, written atomically).
+
+        Args:
+            key: Cache key
+            result: Tuple of (project_id, project_name, project_path)
+        """
+        self._disk_cache[key] = list(result)
+        path = _disk_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._disk_cache, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
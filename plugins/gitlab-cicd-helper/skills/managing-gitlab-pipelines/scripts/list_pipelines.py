@@ -40,15 +40,58 @@ Examples:
 
 import sys
 import argparse
+import json
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 
+try:
+    import orjson  # Optional: C serializer for --json output
+except ImportError:
+    orjson = None
+
 # Add lib directory to path
 sys.path.insert(0, str(Path(__file__).parent / "lib"))
 
 from gitlab_config import GitLabConfig
 from project_resolver import ProjectResolver
 
+# Pipeline status → display emoji
+PIPELINE_STATUS_EMOJI = {
+    'success': '✅',
+    'failed': '❌',
+    'running': '▶️',
+    'pending': '⏳',
+    'canceled': '⊗',
+    'skipped': '⊘',
+    'manual': '⚙️',
+    'created': '◯',
+    'waiting_for_resource': '⏸️',
+    'preparing': '🔧',
+    'scheduled': '📅'
+}
+
+# Largest page size GitLab accepts; bigger --limit values span pages
+PIPELINES_PER_PAGE = 100
+
+# format_time_ago buckets: below the first threshold is "just now", then
+# each threshold starts the matching (divisor, suffix) unit
+TIME_AGO_THRESHOLDS = (60, 3600, 86400, 604800)
+TIME_AGO_UNITS = ((60, 'm'), (3600, 'h'), (86400, 'd'), (604800, 'w'))
+
+# One pipeline in the pretty listing
+PIPELINE_ENTRY = (
+    "\n{emoji} Pipeline #{id}\n"
+    "   Branch: {ref}\n"
+    "   Status: {status}\n"
+    "   Commit: {sha_short}\n"
+    "   Source: {source}\n"
+    "   Created: {time_ago}\n"
+    "   🔗 {web_url}\n"
+)
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -118,7 +161,7 @@ def parse_args():
     parser.add_argument(
         "--latest",
         action="store_true",
-        help="Output only the latest pipeline ID (for scripting)"
+        help="Output only the latest pipeline ID (for scripting; ignores --limit)"
     )
 
     parser.add_argument(
@@ -136,33 +179,24 @@ def parse_args():
     return parser.parse_args()
 
 
-def format_pipeline_status_emoji(status):
-    """Get emoji for pipeline status."""
-    emojis = {
-        'success': '✅',
-        'failed': '❌',
-        'running': '▶️',
-        'pending': '⏳',
-        'canceled': '⊗',
-        'skipped': '⊘',
-        'manual': '⚙️',
-        'created': '◯',
-        'waiting_for_resource': '⏸️',
-        'preparing': '🔧',
-        'scheduled': '📅'
-    }
-    return emojis.get(status, '❓')
-
-
-def format_time_ago(dt_str):
-    """Format datetime string as relative time."""
+def format_time_ago(dt_str, now=None):
+    """Format datetime string as relative time.
+
+    Args:
+        dt_str: ISO 8601 timestamp
+        now: Reference time (aware datetime); pass one in when formatting
+             many timestamps to avoid re-reading the clock for each
+
+    Returns:
+        Relative time such as "5m ago"
+    """
     if not dt_str:
         return "unknown"
 
     try:
         # Parse ISO format datetime
         if dt_str.endswith('Z'):
-            dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+            dt = datetime.fromisoformat(dt_str[:-1] + '+00:00')
         else:
             dt = datetime.fromisoformat(dt_str)
 
@@ -170,30 +204,44 @@ def format_time_ago(dt_str):
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
 
-        now = datetime.now(timezone.utc)
-        diff = now - dt
-
-        seconds = diff.total_seconds()
-
-        if seconds < 60:
-            return "just now"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            return f"{minutes}m ago"
-        elif seconds < 86400:
-            hours = int(seconds / 3600)
-            return f"{hours}h ago"
-        elif seconds < 604800:
-            days = int(seconds / 86400)
-            return f"{days}d ago"
-        else:
-            weeks = int(seconds / 604800)
-            return f"{weeks}w ago"
+        seconds = ((now or datetime.now(timezone.utc)) - dt).total_seconds()
     except Exception:
         return dt_str[:10] if len(dt_str) >= 10 else dt_str
 
+    bucket = bisect_right(TIME_AGO_THRESHOLDS, seconds)
+    if bucket == 0:
+        return "just now"
+    divisor, suffix = TIME_AGO_UNITS[bucket - 1]
+    return f"{int(seconds / divisor)}{suffix} ago"
+
+
+def write_json_array(rows, out):
+    """Write rows as a JSON array, one element at a time.
+
+    The layout matches json.dumps(list(rows), indent=2), but nothing past
+    the current element is held in memory, so output starts with the first
+    page. When orjson is installed, non-ASCII text (refs, usernames) is
+    written as raw UTF-8 rather than \\uXXXX escapes; both decode the same.
 
-def list_pipelines(project, limit=10, ref=None, status=None, source=None, username=None):
+    Args:
+        rows: Iterable of JSON-serializable dicts
+        out: Binary stream to write to
+    """
+    separator = b"[\n  "
+    for row in rows:
+        if orjson is not None:
+            element = orjson.dumps(row, option=orjson.OPT_INDENT_2)
+        else:
+            element = json.dumps(row, indent=2).encode('utf-8')
+        # Nest the element one level inside the array
+        out.write(separator + element.replace(b"\n", b"\n  "))
+        separator = b",\n  "
+    out.write(b"[]\n" if separator == b"[\n  " else b"\n]\n")
+    out.flush()
+
+
+def list_pipelines(project, limit=10, ref=None, status=None, source=None, username=None,
+                   lazy=False):
     """List pipelines for a project.
 
     Args:
@@ -203,12 +251,15 @@ def list_pipelines(project, limit=10, ref=None, status=None, source=None, userna
         status: Filter by pipeline status
         source: Filter by pipeline source
         username: Filter by username
+        lazy: Return an iterator when the limit spans several pages, so
+              later pages are only fetched as the caller consumes them
 
     Returns:
-        List of pipeline objects
+        List (or iterator, if lazy) of pipeline dicts, as returned by the API
     """
-    # Build filter kwargs
-    kwargs = {'per_page': limit}
+    # Build filter kwargs; newest first, spelled out so the first page is
+    # always the most recent pipelines regardless of server defaults
+    kwargs = {'per_page': min(limit, PIPELINES_PER_PAGE), 'order_by': 'id', 'sort': 'desc'}
 
     if ref:
         kwargs['ref'] = ref
@@ -219,64 +270,75 @@ def list_pipelines(project, limit=10, ref=None, status=None, source=None, userna
     if username:
         kwargs['username'] = username
 
-    # Get pipelines (already ordered by ID desc by default)
-    pipelines = project.pipelines.list(**kwargs)
+    # Only plain fields are read, so take the raw JSON page rather than
+    # wrapping every pipeline in a ProjectPipeline object
+    manager = project.pipelines
+    if limit <= PIPELINES_PER_PAGE:
+        return manager.gitlab.http_list(manager.path, query_data=kwargs, get_all=False)
 
-    return pipelines
+    # Larger limits span pages: follow them lazily, stopping at the limit
+    pages = manager.gitlab.http_list(manager.path, query_data=kwargs, iterator=True)
+    pipelines = islice(pages, limit)
+    return pipelines if lazy else list(pipelines)
 
 
 def main():
     """Main entry point."""
     args = parse_args()
+    # Progress and banner lines only appear in the pretty output mode
+    verbose = not (args.quiet or args.latest or args.json)
 
     try:
-        # Initialize configuration and client
-        if not args.quiet and not args.latest and not args.json:
+        # Initialize configuration and client. The auth probe runs in the
+        # background so it overlaps the project and pipeline requests.
+        if verbose:
             print("🔐 Validating tokens...")
 
         config = GitLabConfig()
-        gl = config.get_gitlab_client()
-
-        if not args.quiet and not args.latest and not args.json:
+        gl = config.create_gitlab_client()
+        project_details = None
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            auth = executor.submit(config.validate_gitlab_client, gl)
+            try:
+                # Determine project identifier (--auto or no flag: from the repo)
+                if args.project:
+                    # Listing only needs the ID; the full project (for its name)
+                    # is fetched alongside the pipelines, and only when shown
+                    project = gl.projects.get(args.project, lazy=True)
+                    if verbose:
+                        project_details = executor.submit(gl.projects.get, args.project)
+                else:
+                    if verbose:
+                        print("🔍 Auto-resolving project from current directory...")
+                    resolver = ProjectResolver(gitlab_client=gl)
+                    project = resolver.resolve_project()
+
+                # Get pipelines
+                pipelines = list_pipelines(
+                    project,
+                    # --latest prints one ID; don't fetch a page of them
+                    limit=1 if args.latest else args.limit,
+                    ref=args.ref,
+                    status=args.status,
+                    source=args.source,
+                    username=args.username,
+                    # --json streams pages out as they arrive
+                    lazy=args.json
+                )
+                if project_details:
+                    project = project_details.result()
+            finally:
+                # A bad token also fails the requests; surface the auth error first
+                auth.result()
+
+        if verbose:
             print("✅ Tokens validated")
-
-        # Determine project identifier
-        if args.auto:
-            if not args.quiet and not args.latest and not args.json:
-                print("🔍 Auto-resolving project...")
-            resolver = ProjectResolver(gitlab_client=gl)
-            project_id, project_name, project_path = resolver.resolve_from_repo()
-            project = gl.projects.get(project_id)
-            if not args.quiet and not args.latest and not args.json:
-                print(f"✅ Project: {project_name} (ID: {project.id})\n")
-        elif args.project:
-            project = gl.projects.get(args.project)
-            if not args.quiet and not args.latest and not args.json:
-                print(f"✅ Project: {project.name} (ID: {project.id})\n")
-        else:
-            # Try to auto-resolve
-            if not args.quiet and not args.latest and not args.json:
-                print("🔍 Auto-resolving project from current directory...")
-            resolver = ProjectResolver(gitlab_client=gl)
-            project_id, project_name, project_path = resolver.resolve_from_repo()
-            project = gl.projects.get(project_id)
-            if not args.quiet and not args.latest and not args.json:
-                print(f"✅ Project: {project_name} (ID: {project.id})\n")
-
-        # Get pipelines
-        pipelines = list_pipelines(
-            project,
-            limit=args.limit,
-            ref=args.ref,
-            status=args.status,
-            source=args.source,
-            username=args.username
-        )
+            print(f"✅ Project: {project.name} (ID: {project.id})\n")
 
         if not pipelines:
             if args.latest:
                 # For scripting - output error to stderr so caller knows it failed
-                import sys
                 print("⚠️  No pipelines found matching criteria", file=sys.stderr)
                 if args.ref:
                     print(f"   Filtered by ref: {args.ref}", file=sys.stderr)
@@ -305,30 +367,30 @@ def main():
         # Output based on format
         if args.latest:
             # Just output the latest pipeline ID
-            print(pipelines[0].id)
+            print(pipelines[0]['id'])
             return 0
 
         elif args.json:
-            import json
-            output = []
-            for p in pipelines:
-                output.append({
-                    'id': p.id,
-                    'status': p.status,
-                    'ref': p.ref,
-                    'sha': p.sha[:8] if hasattr(p, 'sha') and p.sha else None,
-                    'source': p.source if hasattr(p, 'source') else None,
-                    'created_at': p.created_at,
-                    'updated_at': p.updated_at,
-                    'web_url': p.web_url
-                })
-            print(json.dumps(output, indent=2))
+            rows = (
+                {
+                    'id': p['id'],
+                    'status': p['status'],
+                    'ref': p['ref'],
+                    'sha': p['sha'][:8] if p.get('sha') else None,
+                    'source': p.get('source'),
+                    'created_at': p.get('created_at'),
+                    'updated_at': p.get('updated_at'),
+                    'web_url': p['web_url']
+                }
+                for p in pipelines
+            )
+            sys.stdout.flush()
+            write_json_array(rows, sys.stdout.buffer)
             return 0
 
         elif args.quiet:
             # Just output pipeline IDs
-            for p in pipelines:
-                print(p.id)
+            sys.stdout.write("".join(f"{p['id']}\n" for p in pipelines))
             return 0
 
         else:
@@ -350,27 +412,28 @@ def main():
             print(f"📋 Recent Pipelines{filter_str}")
             print(f"{'='*80}")
 
+            # One write for all entries instead of seven print() calls each
+            blocks = []
+            now = datetime.now(timezone.utc)
             for p in pipelines:
-                emoji = format_pipeline_status_emoji(p.status)
-                time_ago = format_time_ago(p.created_at)
-                sha_short = p.sha[:8] if hasattr(p, 'sha') and p.sha else "--------"
-                source = p.source if hasattr(p, 'source') else "unknown"
-
-                # Main line
-                print(f"\n{emoji} Pipeline #{p.id}")
-                print(f"   Branch: {p.ref}")
-                print(f"   Status: {p.status}")
-                print(f"   Commit: {sha_short}")
-                print(f"   Source: {source}")
-                print(f"   Created: {time_ago}")
-                print(f"   🔗 {p.web_url}")
+                blocks.append(PIPELINE_ENTRY.format(
+                    emoji=PIPELINE_STATUS_EMOJI.get(p['status'], '❓'),
+                    id=p['id'],
+                    ref=p['ref'],
+                    status=p['status'],
+                    sha_short=p['sha'][:8] if p.get('sha') else "--------",
+                    source=p.get('source') or "unknown",
+                    time_ago=format_time_ago(p.get('created_at'), now),
+                    web_url=p['web_url']
+                ))
+            sys.stdout.write("".join(blocks))
 
             print(f"\n{'='*80}")
             print(f"Total: {len(pipelines)} pipeline(s)")
 
             # Show helpful commands
             if pipelines:
-                latest_id = pipelines[0].id
+                latest_id = pipelines[0]['id']
                 print(f"\n💡 Quick actions for latest pipeline #{latest_id}:")
                 print(f"   Monitor:  ./scripts/monitor_status.py --pipeline {latest_id} --auto --watch")
                 print(f"   Jobs:     ./scripts/launch_jobs.py --pipeline {latest_id} --auto --batch")
@@ -383,13 +446,11 @@ def main():
     except ValueError as e:
         # Authentication or configuration errors - always print to stderr
         # so Claude can see them even in --quiet/--latest/--json modes
-        import sys
         print(str(e), file=sys.stderr)
         return 1
 
     except Exception as e:
         # Other errors - print with traceback for debugging
-        import sys
         print(f"❌ Failed to list pipelines: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc(file=sys.stderr)
@@ -32,11 +32,24 @@ Examples:
 
     # Compare config vs actual state
     monitor_status.py --pipeline 12345 --auto --compare
+
+    # Stream one JSON object per refresh (ndjson) for other tools
+    monitor_status.py --pipeline 12345 --auto --watch --json
 """
 
 import sys
 import argparse
+import hmac
+import json
+import os
+import random
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 
 # Add lib directory to path
@@ -46,6 +59,39 @@ from gitlab_config import GitLabConfig
 from pipeline_analyzer import PipelineAnalyzer
 from project_resolver import ProjectResolver
 
+# Watch back-off while the pipeline is unchanged
+WATCH_BACKOFF = 1.5
+MAX_WATCH_INTERVAL = 60
+
+# Webhook wake-ups are coalesced so a burst of job events (one per job)
+# triggers at most one refresh per this many seconds
+WEBHOOK_MIN_INTERVAL = 2
+
+# Statuses after which no more updates are expected
+TERMINAL_STATUSES = frozenset({'success', 'failed', 'canceled', 'skipped'})
+
+# Status counts shown on the progress line, in display order
+PROGRESS_STATUS_ICONS = (
+    ('running', '▶️ '),
+    ('pending', '⏳'),
+    ('success', '✅'),
+    ('failed', '❌'),
+    ('manual', '⚙️ '),
+    ('created', '◯'),
+)
+
+# Job/pipeline status → display emoji
+STATUS_EMOJI = {
+    'success': '✅',
+    'failed': '❌',
+    'running': '▶️',
+    'pending': '⏳',
+    'canceled': '⊗',
+    'skipped': '⊘',
+    'manual': '⚙️',
+    'created': '◯'
+}
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -92,7 +138,39 @@ def parse_args():
         "--interval",
         type=int,
         default=5,
-        help="Refresh interval in seconds for watch mode (default: 5)"
+        help="Refresh interval in seconds for watch mode (default: 5, backs off up to --max-interval while nothing changes)"
+    )
+
+    parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=MAX_WATCH_INTERVAL,
+        help=f"Longest refresh delay while nothing changes (default: {MAX_WATCH_INTERVAL})"
+    )
+
+    parser.add_argument(
+        "--backoff",
+        type=float,
+        default=WATCH_BACKOFF,
+        help=f"Delay multiplier per unchanged refresh (default: {WATCH_BACKOFF})"
+    )
+
+    parser.add_argument(
+        "--webhook-port",
+        type=int,
+        help="Also listen for GitLab pipeline/job webhooks on this port and refresh as soon as one arrives for the watched pipeline or job (polling continues as a fallback)"
+    )
+
+    parser.add_argument(
+        "--webhook-host",
+        default="127.0.0.1",
+        help="Address the webhook listener binds to (default: 127.0.0.1; use 0.0.0.0 to accept hooks from other hosts)"
+    )
+
+    parser.add_argument(
+        "--webhook-secret",
+        default=os.environ.get("GITLAB_WEBHOOK_SECRET"),
+        help="Secret token configured on the GitLab webhook; requests without a matching X-Gitlab-Token are rejected (default: $GITLAB_WEBHOOK_SECRET)"
     )
 
     parser.add_argument(
@@ -107,6 +185,18 @@ def parse_args():
         help="Show jobs list for pipeline monitoring"
     )
 
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Write pipeline/job status as one compact JSON object per refresh (ndjson); other messages go to stderr"
+    )
+
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Print full tracebacks on errors (also enabled by GITLAB_DEBUG=1)"
+    )
+
     # Pipeline awareness options
     parser.add_argument(
         "--structure",
@@ -125,20 +215,170 @@ def parse_args():
 
 def format_job_status_emoji(status):
     """Get emoji for job status."""
-    emojis = {
-        'success': '✅',
-        'failed': '❌',
-        'running': '▶️',
-        'pending': '⏳',
-        'canceled': '⊗',
-        'skipped': '⊘',
-        'manual': '⚙️',
-        'created': '◯'
-    }
-    return emojis.get(status, '❓')
+    return STATUS_EMOJI.get(status, '❓')
+
+
+def next_interval(current, base, active, backoff=WATCH_BACKOFF, max_interval=MAX_WATCH_INTERVAL):
+    """Compute the next watch delay.
+
+    Activity resets the delay to the base interval; otherwise it grows by
+    backoff up to max_interval, with jitter so concurrent watchers don't
+    poll in lockstep.
+
+    Args:
+        current: Current delay in seconds
+        base: Base interval (--interval)
+        active: Whether anything changed since the last refresh
+        backoff: Growth factor per unchanged refresh (--backoff)
+        max_interval: Delay ceiling in seconds (--max-interval)
+
+    Returns:
+        Next delay in seconds
+    """
+    if active:
+        return base
+    delay = current * backoff
+    jittered = delay + random.uniform(0, delay * 0.2)
+    # Clamp after jittering so the ceiling is never exceeded
+    return min(jittered, max(base, max_interval))
+
+
+def start_webhook_listener(port, pipeline_id=None, job_id=None, host="127.0.0.1", secret=None):
+    """Listen for GitLab webhooks that concern the watched pipeline or job.
+
+    Pipeline and job hook payloads only wake the watch loop early; the state
+    itself is still read from the API, so the payload is never trusted.
+
+    Args:
+        port: TCP port to listen on
+        pipeline_id: Pipeline being watched
+        job_id: Job being watched
+        host: Address to bind to
+        secret: Expected X-Gitlab-Token value; None accepts any request
+
+    Returns:
+        threading.Event set whenever a matching event arrives
+    """
+    wake = threading.Event()
+
+    class WebhookHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if secret is not None and not hmac.compare_digest(
+                    self.headers.get('X-Gitlab-Token', '').encode(), secret.encode()):
+                self.send_response(401)
+                self.end_headers()
+                return
+
+            try:
+                length = int(self.headers.get('Content-Length') or 0)
+                event = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                event = {}
+            if not isinstance(event, dict):
+                event = {}
+
+            kind = event.get('object_kind')
+            if kind == 'pipeline':
+                matched = (event.get('object_attributes') or {}).get('id') == pipeline_id
+            elif kind == 'build':
+                matched = (event.get('pipeline_id') == pipeline_id
+                           or event.get('build_id') == job_id)
+            else:
+                matched = False
+            if matched and (pipeline_id or job_id):
+                wake.set()
+
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass  # keep the watch output clean
+
+    server = ThreadingHTTPServer((host, port), WebhookHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return wake
+
+
+def wait_for_refresh(delay, wake=None, started=None):
+    """Sleep until the next refresh, or until a webhook wakes the watch.
+
+    Args:
+        delay: Seconds between refreshes
+        wake: Event from start_webhook_listener(), or None to just sleep
+        started: time.monotonic() at the start of this refresh; the time the
+            refresh itself took is deducted so the period doesn't drift
+
+    Returns:
+        True if a webhook cut the wait short
+    """
+    if started is None:
+        started = time.monotonic()
+    remaining = max(0.0, started + delay - time.monotonic())
+    if wake is None:
+        time.sleep(remaining)
+        return False
+    if not wake.wait(remaining):
+        return False
+    # Space webhook-driven refreshes apart; events arriving meanwhile
+    # are folded into this wake-up
+    time.sleep(max(0.0, started + WEBHOOK_MIN_INTERVAL - time.monotonic()))
+    wake.clear()
+    return True
+
+
+def print_refresh_header(iteration):
+    """Print the separator shown before each watch refresh (one write)."""
+    rule = "=" * 60
+    sys.stdout.write(f"\n{rule}\nRefresh #{iteration} at {time.strftime('%H:%M:%S')}\n{rule}\n\n")
+
+
+def write_json_record(out, record):
+    """Write one timestamped status record as a compact JSON line.
+
+    Args:
+        out: Text stream receiving the ndjson records
+        record: JSON-serializable dict
+    """
+    record = {'ts': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()), **record}
+    out.write(json.dumps(record, separators=(',', ':')) + '\n')
+    out.flush()  # consumers tail the stream; don't let records sit in a pipe buffer
 
 
-def monitor_pipeline(analyzer, pipeline_id, show_jobs=False, previous_jobs=None):
+def report_unchanged(pipeline, delay, json_out=None):
+    """Report a watch refresh that found nothing new, as a one-line heartbeat.
+
+    Args:
+        pipeline: Pipeline object from the refresh
+        delay: Seconds until the next check
+        json_out: Stream to also write a JSON heartbeat record to
+    """
+    print(f"   ⏸️  No changes at {time.strftime('%H:%M:%S')}, next check in {delay:.0f}s")
+    if json_out is not None:
+        write_json_record(json_out, {
+            'pipeline': {
+                'id': pipeline.id,
+                'status': pipeline.status,
+                'updated_at': pipeline.updated_at
+            },
+            'unchanged': True,
+            'next_check': round(delay, 1)
+        })
+
+
+def job_states(jobs):
+    """Snapshot job statuses for change tracking between refreshes.
+
+    Args:
+        jobs: List of job objects
+
+    Returns:
+        Dict mapping job ID to {'name', 'status'}
+    """
+    return {job.id: {'name': job.name, 'status': job.status} for job in jobs}
+
+
+def monitor_pipeline(analyzer, pipeline_id, show_jobs=False, previous_jobs=None, json_out=None):
     """Monitor pipeline status using PipelineAnalyzer.
 
     Args:
@@ -146,77 +386,105 @@ def monitor_pipeline(analyzer, pipeline_id, show_jobs=False, previous_jobs=None)
         pipeline_id: Pipeline ID
         show_jobs: Show jobs list
         previous_jobs: Dict of previous job statuses for change tracking
+        json_out: Stream to write a JSON record to instead of the text report
 
     Returns:
-        Tuple of (pipeline_status, current_jobs_dict)
+        Tuple of (pipeline_status, current_jobs_dict, active) where active
+        is True if any job is running or changed status since previous_jobs
     """
-    pipeline = analyzer.get_pipeline(pipeline_id)
-
-    # Display pipeline info
-    print(f"\n{'='*60}")
-    print(f"Pipeline #{pipeline.id}")
-    print(f"{'='*60}")
-    print(f"Status: {pipeline.status}")
-    print(f"Branch: {pipeline.ref}")
-    print(f"Created: {pipeline.created_at}")
-    print(f"Updated: {pipeline.updated_at}")
-    print(f"🔗 {pipeline.web_url}")
-
-    # Get pipeline summary for progress stats
-    summary = analyzer.get_pipeline_summary(pipeline_id)
-    jobs_by_status = summary.get('jobs_by_status', {})
-    total_jobs = summary.get('total_jobs', 0)
+    # The pipeline and its job listing are independent requests; issue them together
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        jobs_future = executor.submit(analyzer.get_all_jobs, pipeline_id)
+        pipeline = analyzer.get_pipeline(pipeline_id)
+        all_jobs = jobs_future.result()
+
+    # Progress stats straight from the job listing
+    jobs_by_status = Counter(job.status for job in all_jobs)
+    total_jobs = len(all_jobs)
 
     # Calculate completion info
-    completed_jobs = jobs_by_status.get('success', 0) + jobs_by_status.get('failed', 0) + jobs_by_status.get('canceled', 0) + jobs_by_status.get('skipped', 0)
+    completed_jobs = sum(jobs_by_status[status] for status in TERMINAL_STATUSES)
     completion_pct = (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0
 
+    # One pass over the listing: jobs dict for tracking, running jobs, and
+    # jobs that changed status since the previous refresh
+    current_jobs = {}
+    running_jobs = []
+    changed_jobs = []
+    previous_jobs = previous_jobs or {}
+    for job in all_jobs:
+        status = job.status
+        current_jobs[job.id] = {'name': job.name, 'status': status}
+        if status == 'running':
+            running_jobs.append(job)
+        previous = previous_jobs.get(job.id)
+        if previous is not None and previous['status'] != status:
+            changed_jobs.append({
+                'job': job,
+                'prev_status': previous['status'],
+                'current_status': status
+            })
+
+    active = bool(running_jobs or changed_jobs)
+
+    if json_out is not None:
+        record = {
+            'pipeline': {
+                'id': pipeline.id,
+                'status': pipeline.status,
+                'ref': pipeline.ref,
+                'updated_at': pipeline.updated_at,
+                'web_url': pipeline.web_url
+            },
+            'completed': completed_jobs,
+            'total': total_jobs,
+            'jobs_by_status': dict(jobs_by_status),
+            'running': [
+                {'id': job.id, 'name': job.name, 'stage': job.stage,
+                 'duration': getattr(job, 'duration', None)}
+                for job in running_jobs
+            ],
+            'changed': [
+                {'id': change['job'].id, 'name': change['job'].name,
+                 'status': change['current_status'], 'prev_status': change['prev_status']}
+                for change in changed_jobs
+            ]
+        }
+        if show_jobs:
+            record['jobs'] = [
+                {'id': job.id, 'name': job.name, 'stage': job.stage, 'status': job.status}
+                for job in all_jobs
+            ]
+        write_json_record(json_out, record)
+        return pipeline.status, current_jobs, active
+
+    # Display pipeline info (collected and written in one go)
+    out = []
+    out.append(f"\n{'='*60}")
+    out.append(f"Pipeline #{pipeline.id}")
+    out.append(f"{'='*60}")
+    out.append(f"Status: {pipeline.status}")
+    out.append(f"Branch: {pipeline.ref}")
+    out.append(f"Created: {pipeline.created_at}")
+    out.append(f"Updated: {pipeline.updated_at}")
+    out.append(f"🔗 {pipeline.web_url}")
+
     # Show progress summary
-    print(f"\n📊 Progress: {completed_jobs}/{total_jobs} jobs ({completion_pct:.0f}%)")
+    out.append(f"\n📊 Progress: {completed_jobs}/{total_jobs} jobs ({completion_pct:.0f}%)")
 
     # Show job counts by status
-    status_line_parts = []
-    if jobs_by_status.get('running', 0) > 0:
-        status_line_parts.append(f"▶️  {jobs_by_status['running']} running")
-    if jobs_by_status.get('pending', 0) > 0:
-        status_line_parts.append(f"⏳ {jobs_by_status['pending']} pending")
-    if jobs_by_status.get('success', 0) > 0:
-        status_line_parts.append(f"✅ {jobs_by_status['success']} success")
-    if jobs_by_status.get('failed', 0) > 0:
-        status_line_parts.append(f"❌ {jobs_by_status['failed']} failed")
-    if jobs_by_status.get('manual', 0) > 0:
-        status_line_parts.append(f"⚙️  {jobs_by_status['manual']} manual")
-    if jobs_by_status.get('created', 0) > 0:
-        status_line_parts.append(f"◯ {jobs_by_status['created']} created")
+    status_line_parts = [
+        f"{icon} {jobs_by_status[status]} {status}"
+        for status, icon in PROGRESS_STATUS_ICONS
+        if jobs_by_status[status]
+    ]
 
     if status_line_parts:
-        print(f"   {' | '.join(status_line_parts)}")
-
-    # Get all jobs for tracking and display
-    all_jobs = analyzer.get_all_jobs(pipeline_id)
-
-    # Build current jobs dict for tracking
-    current_jobs = {job.id: {'name': job.name, 'status': job.status} for job in all_jobs}
-
-    # Detect running jobs
-    running_jobs = [job for job in all_jobs if job.status == 'running']
-
-    # Detect changed jobs (if we have previous state)
-    changed_jobs = []
-    if previous_jobs:
-        for job in all_jobs:
-            if job.id in previous_jobs:
-                prev_status = previous_jobs[job.id]['status']
-                if prev_status != job.status:
-                    changed_jobs.append({
-                        'job': job,
-                        'prev_status': prev_status,
-                        'current_status': job.status
-                    })
+        out.append(f"   {' | '.join(status_line_parts)}")
 
     # Show running jobs prominently
     if running_jobs:
-        print(f"\n🔄 Currently Running ({len(running_jobs)}):")
+        out.append(f"\n🔄 Currently Running ({len(running_jobs)}):")
         for job in running_jobs:
             # Try to get duration if available
             duration_str = ""
@@ -224,67 +492,88 @@ def monitor_pipeline(analyzer, pipeline_id, show_jobs=False, previous_jobs=None)
                 minutes = int(job.duration) // 60
                 seconds = int(job.duration) % 60
                 duration_str = f" ({minutes}m {seconds}s)"
-            print(f"   ▶️  {job.name} [{job.stage}]{duration_str}")
+            out.append(f"   ▶️  {job.name} [{job.stage}]{duration_str}")
 
     # Show recently changed jobs
     if changed_jobs:
-        print(f"\n✨ Recently Changed ({len(changed_jobs)}):")
+        out.append(f"\n✨ Recently Changed ({len(changed_jobs)}):")
         for change in changed_jobs:
             job = change['job']
             prev_emoji = format_job_status_emoji(change['prev_status'])
             curr_emoji = format_job_status_emoji(change['current_status'])
-            print(f"   {curr_emoji} {job.name} → {change['current_status']} (was {prev_emoji} {change['prev_status']})")
+            out.append(f"   {curr_emoji} {job.name} → {change['current_status']} (was {prev_emoji} {change['prev_status']})")
 
     # Show jobs if requested
     if show_jobs:
-        # Use proper pagination to get ALL jobs (already fetched above)
-        jobs_by_stage = analyzer.get_jobs_by_stage(pipeline_id)
+        # Group the jobs fetched above by stage (stages in pipeline order),
+        # sorting once overall rather than once per stage
+        jobs_by_stage = {job.stage: [] for job in all_jobs}
+        for job in sorted(all_jobs, key=attrgetter('name')):
+            jobs_by_stage[job.stage].append(job)
 
-        print(f"\n📋 Jobs ({len(all_jobs)} total):")
+        out.append(f"\n📋 Jobs ({len(all_jobs)} total):")
         for stage, jobs in jobs_by_stage.items():
-            print(f"\n  {stage}:")
-            for job in sorted(jobs, key=lambda j: j.name):
-                emoji = format_job_status_emoji(job.status)
-                print(f"    {emoji} {job.name} [{job.status}]")
+            out.append(f"\n  {stage}:")
+            for job in jobs:
+                emoji = STATUS_EMOJI.get(job.status, '❓')
+                out.append(f"    {emoji} {job.name} [{job.status}]")
 
-    print(f"{'='*60}\n")
+    out.append(f"{'='*60}\n")
+    sys.stdout.write('\n'.join(out) + '\n')
 
-    return pipeline.status, current_jobs
+    return pipeline.status, current_jobs, active
 
 
-def monitor_job(project, job_id):
+def monitor_job(project, job_id, json_out=None):
     """Monitor job status using python-gitlab.
 
     Args:
         project: GitLab project object
         job_id: Job ID
+        json_out: Stream to write a JSON record to instead of the text report
 
     Returns:
         Job status string
     """
     job = project.jobs.get(job_id)
 
-    # Display job info
-    print(f"\n{'='*60}")
-    print(f"Job #{job.id}: {job.name}")
-    print(f"{'='*60}")
+    if json_out is not None:
+        write_json_record(json_out, {'job': {
+            'id': job.id,
+            'name': job.name,
+            'status': job.status,
+            'stage': job.stage,
+            'pipeline_id': job.pipeline['id'],
+            'started_at': getattr(job, 'started_at', None),
+            'finished_at': getattr(job, 'finished_at', None),
+            'duration': getattr(job, 'duration', None),
+            'web_url': getattr(job, 'web_url', None)
+        }})
+        return job.status
+
+    # Display job info (collected and written in one go)
+    out = []
+    out.append(f"\n{'='*60}")
+    out.append(f"Job #{job.id}: {job.name}")
+    out.append(f"{'='*60}")
     emoji = format_job_status_emoji(job.status)
-    print(f"Status: {emoji} {job.status}")
-    print(f"Stage: {job.stage}")
-    print(f"Pipeline: #{job.pipeline['id']}")
+    out.append(f"Status: {emoji} {job.status}")
+    out.append(f"Stage: {job.stage}")
+    out.append(f"Pipeline: #{job.pipeline['id']}")
 
     # Show timing information
     if hasattr(job, 'started_at') and job.started_at:
-        print(f"Started: {job.started_at}")
+        out.append(f"Started: {job.started_at}")
     if hasattr(job, 'finished_at') and job.finished_at:
-        print(f"Finished: {job.finished_at}")
+        out.append(f"Finished: {job.finished_at}")
     if hasattr(job, 'duration') and job.duration:
-        print(f"Duration: {job.duration}s")
+        out.append(f"Duration: {job.duration}s")
 
     if hasattr(job, 'web_url'):
-        print(f"🔗 {job.web_url}")
+        out.append(f"🔗 {job.web_url}")
 
-    print(f"{'='*60}\n")
+    out.append(f"{'='*60}\n")
+    sys.stdout.write('\n'.join(out) + '\n')
 
     return job.status
 
@@ -298,8 +587,7 @@ def is_terminal_status(status):
     Returns:
         True if terminal, False otherwise
     """
-    terminal_statuses = ['success', 'failed', 'canceled', 'skipped']
-    return status in terminal_statuses
+    return status in TERMINAL_STATUSES
 
 
 def check_pattern_completion(analyzer, pipeline_id, pattern):
@@ -359,34 +647,42 @@ def main():
     """Main entry point."""
     args = parse_args()
 
+    json_out = None
+    if args.json:
+        # stdout carries only the ndjson records; progress and notices go to stderr
+        json_out, sys.stdout = sys.stdout, sys.stderr
+
     try:
-        # Initialize configuration and client
+        # Initialize configuration and client. The auth probe runs in the
+        # background so it overlaps the project lookup instead of preceding it.
         print("🔐 Validating tokens...")
         config = GitLabConfig()
-        gl = config.get_gitlab_client()
-        print("✅ Tokens validated")
+        # Watch loops re-request the same pages every refresh
+        gl = config.create_gitlab_client(revalidate_gets=args.watch)
+        if args.watch:
+            # Ride out 5xx blips with python-gitlab's own backoff instead of
+            # ending a long watch on a transient error
+            gl.retry_transient_errors = True
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            auth = executor.submit(config.validate_gitlab_client, gl)
+            try:
+                # Determine project identifier
+                if args.project and not args.auto:
+                    project = gl.projects.get(args.project)
+                else:
+                    print("🔍 Auto-resolving project from current directory...")
+                    resolver = ProjectResolver(gitlab_client=gl)
+                    project = resolver.resolve_project()
+            finally:
+                # A bad token also fails the lookup; surface the auth error first
+                auth.result()
 
-        # Determine project identifier
-        if args.auto:
-            print("🔍 Auto-resolving project...")
-            resolver = ProjectResolver(gitlab_client=gl)
-            project_id, project_name, project_path = resolver.resolve_from_repo()
-            project = gl.projects.get(project_id)
-            print(f"✅ Project: {project_name} (ID: {project.id})\n")
-        elif args.project:
-            project_identifier = args.project
-            project = gl.projects.get(project_identifier)
-            print(f"✅ Project: {project.name} (ID: {project.id})\n")
-        else:
-            # Try to auto-resolve
-            print("🔍 Auto-resolving project from current directory...")
-            resolver = ProjectResolver(gitlab_client=gl)
-            project_id, project_name, project_path = resolver.resolve_from_repo()
-            project = gl.projects.get(project_id)
-            print(f"✅ Project: {project_name} (ID: {project.id})\n")
+        print("✅ Tokens validated")
+        print(f"✅ Project: {project.name} (ID: {project.id})\n")
 
         # Initialize pipeline analyzer
-        analyzer = PipelineAnalyzer(gl, project.id)
+        analyzer = PipelineAnalyzer(gl, project)
 
         # Monitor pipeline or job
         if args.pipeline:
@@ -403,24 +699,24 @@ def main():
                 pipeline = analyzer.get_pipeline(args.pipeline)
                 ref = pipeline.ref
 
-                # Parse config
+                # Parse config while the job counts load in the background
                 print(f"🔍 Parsing .gitlab-ci.yml from {ref}...")
-                config_data = analyzer.parse_gitlab_ci_config(ref)
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    summary_future = executor.submit(analyzer.get_pipeline_summary, args.pipeline)
+                    config_data = analyzer.parse_gitlab_ci_config(ref, sha=pipeline.sha)
+                    summary = summary_future.result()
 
                 if config_data:
                     print("✅ Config parsed successfully")
 
-                    # Get actual pipeline state with proper pagination
-                    all_jobs = analyzer.get_all_jobs(args.pipeline)
-                    summary = analyzer.get_pipeline_summary(args.pipeline)
-
                     print(f"\n📋 Pipeline Summary:")
                     print(f"   Total jobs: {summary['total_jobs']}")
                     print(f"   Stages: {len(summary['stages'])}")
                     print(f"\n   Jobs by status:")
-                    for status, count in sorted(summary['jobs_by_status'].items()):
-                        emoji = format_job_status_emoji(status)
-                        print(f"      {emoji} {status:12} {count:3} jobs")
+                    sys.stdout.write(''.join(
+                        f"      {format_job_status_emoji(status)} {status:12} {count:3} jobs\n"
+                        for status, count in sorted(summary['jobs_by_status'].items())
+                    ))
                 else:
                     print("⚠️  Could not parse .gitlab-ci.yml")
 
@@ -443,18 +739,71 @@ def main():
 
                 print()  # blank line
 
+                wake = None
+                if args.webhook_port:
+                    wake = start_webhook_listener(args.webhook_port, pipeline_id=args.pipeline,
+                                                  host=args.webhook_host, secret=args.webhook_secret)
+                    print(f"📡 Listening for GitLab webhooks on {args.webhook_host}:{args.webhook_port}")
+
                 iteration = 0
                 previous_jobs = None
                 no_match_iterations = 0  # Track iterations with no pattern matches
+                last_seen = None  # (status, updated_at) at the last full refresh
+                last_listed = 0.0  # time.monotonic() of the last job listing
+                woken = False  # the last wait was cut short by a webhook
+                delay = args.interval
 
                 while True:
+                    started = time.monotonic()
+                    # Drop last tick's API results so every refresh is live
+                    analyzer.clear_cache()
+
+                    # Same notion of activity as monitor_pipeline(): with no job
+                    # changes, running jobs alone keep the base interval
+                    jobs_running = any(job['status'] == 'running' for job in (previous_jobs or {}).values())
+
+                    if last_seen is not None:
+                        # Cheap probe: a single pipeline GET. Jobs are only re-listed
+                        # once the pipeline has moved, or when the last listing is
+                        # --max-interval seconds old, as not every job transition
+                        # touches the pipeline. Pattern watches always list, since
+                        # their completion depends on individual jobs, and so does
+                        # a webhook wake-up (job events rarely move the pipeline).
+                        pipeline = analyzer.get_pipeline(args.pipeline)
+                        if ((pipeline.status, pipeline.updated_at) == last_seen
+                                and not args.watch_pattern
+                                and not woken
+                                and started - last_listed < args.max_interval):
+                            delay = next_interval(delay, args.interval, jobs_running, args.backoff, args.max_interval)
+                            report_unchanged(pipeline, delay, json_out)
+                            woken = wait_for_refresh(delay, wake, started)
+                            continue
+
+                    last_listed = started
+
+                    if last_seen is not None and no_match_iterations == 0:
+                        # Pipeline record moved, but if no job changed status the
+                        # full report would be identical: print a heartbeat instead
+                        unchanged = (
+                            pipeline.status == last_seen[0]
+                            and job_states(analyzer.get_all_jobs(args.pipeline)) == previous_jobs
+                        )
+                        last_seen = (pipeline.status, pipeline.updated_at)
+                        if unchanged:
+                            # No back-off on a webhook-driven tick: more events are likely
+                            delay = next_interval(delay, args.interval, jobs_running or woken,
+                                                  args.backoff, args.max_interval)
+                            report_unchanged(pipeline, delay, json_out)
+                            woken = wait_for_refresh(delay, wake, started)
+                            continue
+
                     if iteration > 0:
-                        # Clear screen for better readability
-                        print("\n" + "="*60)
-                        print(f"Refresh #{iteration} at {time.strftime('%H:%M:%S')}")
-                        print("="*60 + "\n")
+                        print_refresh_header(iteration)
 
-                    status, current_jobs = monitor_pipeline(analyzer, args.pipeline, show_jobs=args.show_jobs or args.watch, previous_jobs=previous_jobs)
+                    status, current_jobs, active = monitor_pipeline(analyzer, args.pipeline, show_jobs=args.show_jobs or args.watch, previous_jobs=previous_jobs, json_out=json_out)
+                    delay = next_interval(delay, args.interval, active or woken, args.backoff, args.max_interval)
+                    pipeline = analyzer.get_pipeline(args.pipeline)
+                    last_seen = (pipeline.status, pipeline.updated_at)
 
                     # Check termination conditions
                     if args.watch_pattern:
@@ -492,9 +841,8 @@ def main():
                                 for job_name in status_groups[job_status]:
                                     print(f"      - {job_name}")
 
-                            # Note about non-matching jobs
-                            all_jobs = analyzer.get_all_jobs(args.pipeline)
-                            other_jobs = len(all_jobs) - stats['total']
+                            # Note about non-matching jobs (current_jobs holds this tick's listing)
+                            other_jobs = len(current_jobs) - stats['total']
                             if other_jobs > 0:
                                 print(f"\nℹ️  Note: {other_jobs} other pipeline jobs are still running/pending")
                                 print(f"   Use --watch without --watch-pattern to monitor entire pipeline")
@@ -503,14 +851,16 @@ def main():
                         else:
                             # Still waiting on some jobs
                             no_match_iterations = 0  # Reset counter since we found matches
-                            print(f"\n🎯 Pattern Watch Progress: {stats['completed']}/{stats['total']} jobs complete")
-                            if stats['non_terminal_jobs']:
-                                print(f"   Still waiting on {len(stats['non_terminal_jobs'])} job(s):")
-                                for job in stats['non_terminal_jobs'][:5]:  # Show first 5
+                            out = [f"\n🎯 Pattern Watch Progress: {stats['completed']}/{stats['total']} jobs complete"]
+                            waiting = len(stats['non_terminal_jobs'])
+                            if waiting:
+                                out.append(f"   Still waiting on {waiting} job(s):")
+                                for job in islice(stats['non_terminal_jobs'], 5):  # Show first 5
                                     emoji = format_job_status_emoji(job['status'])
-                                    print(f"      {emoji} {job['name']} [{job['status']}]")
-                                if len(stats['non_terminal_jobs']) > 5:
-                                    print(f"      ... and {len(stats['non_terminal_jobs']) - 5} more")
+                                    out.append(f"      {emoji} {job['name']} [{job['status']}]")
+                                if waiting > 5:
+                                    out.append(f"      ... and {waiting - 5} more")
+                            sys.stdout.write('\n'.join(out) + '\n')
                     else:
                         # Standard pipeline-level termination (existing behavior)
                         if is_terminal_status(status):
@@ -520,30 +870,40 @@ def main():
                     # Update previous_jobs for next iteration
                     previous_jobs = current_jobs
                     iteration += 1
-                    time.sleep(args.interval)
+                    woken = wait_for_refresh(delay, wake, started)
             else:
-                status, _ = monitor_pipeline(analyzer, args.pipeline, show_jobs=args.show_jobs)
+                status, _, _ = monitor_pipeline(analyzer, args.pipeline, show_jobs=args.show_jobs, json_out=json_out)
 
         elif args.job:
             if args.watch:
                 print(f"👁️  Watching job {args.job} (refresh every {args.interval}s, Ctrl+C to stop)\n")
+                wake = None
+                if args.webhook_port:
+                    wake = start_webhook_listener(args.webhook_port, job_id=args.job,
+                                                  host=args.webhook_host, secret=args.webhook_secret)
+                    print(f"📡 Listening for GitLab webhooks on {args.webhook_host}:{args.webhook_port}\n")
                 iteration = 0
+                previous_status = None
+                woken = False
+                delay = args.interval
                 while True:
+                    started = time.monotonic()
                     if iteration > 0:
-                        print("\n" + "="*60)
-                        print(f"Refresh #{iteration} at {time.strftime('%H:%M:%S')}")
-                        print("="*60 + "\n")
+                        print_refresh_header(iteration)
 
-                    status = monitor_job(project, args.job)
+                    status = monitor_job(project, args.job, json_out=json_out)
 
                     if is_terminal_status(status):
                         print(f"\n✅ Job reached terminal status: {status}")
                         break
 
+                    delay = next_interval(delay, args.interval, woken or status != previous_status,
+                                          args.backoff, args.max_interval)
+                    previous_status = status
                     iteration += 1
-                    time.sleep(args.interval)
+                    woken = wait_for_refresh(delay, wake, started)
             else:
-                status = monitor_job(project, args.job)
+                status = monitor_job(project, args.job, json_out=json_out)
 
         return 0
 
@@ -551,9 +911,13 @@ def main():
         print("\n\n⚠️  Monitoring stopped by user")
         return 0
     except Exception as e:
-        print(f"❌ Monitoring failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if args.debug or os.environ.get("GITLAB_DEBUG"):
+            print(f"❌ Monitoring failed: {e}")
+            import traceback
+            traceback.print_exc()
+        else:
+            print(f"❌ Monitoring failed: {type(e).__name__}: {e}")
+            print("   Re-run with --debug (or GITLAB_DEBUG=1) for the full traceback")
         return 1
 
 
@@ -39,6 +39,9 @@ from gitlab_config import GitLabConfig
 from pipeline_analyzer import PipelineAnalyzer
 from project_resolver import ProjectResolver
 
+# Delays between job-creation checks for --show-structure (~4s budget)
+STRUCTURE_POLL_DELAYS = (0.2, 0.3, 0.5, 1.0, 2.0)
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -105,12 +108,12 @@ def parse_variables(var_list):
 
     variables = {}
     for var in var_list:
-        if '=' not in var:
+        key, sep, value = var.partition('=')
+        if not sep:
             print(f"⚠️  Warning: Ignoring invalid variable format: {var}")
             print(f"   Expected format: KEY=VALUE")
             continue
 
-        key, value = var.split('=', 1)
         variables[key] = value
 
     return variables
@@ -155,9 +158,8 @@ def main():
         if args.auto:
             print("🔍 Auto-resolving project from git remote...")
             resolver = ProjectResolver(gitlab_client=gl)
-            project_id, project_name, project_path = resolver.resolve_from_repo()
-            project = gl.projects.get(project_id)
-            print(f"✅ Project resolved: {project_name} (ID: {project.id})")
+            project = resolver.resolve_project()
+            print(f"✅ Project resolved: {project.name} (ID: {project.id})")
 
         elif args.project:
             project_identifier = args.project
@@ -202,10 +204,16 @@ def main():
 
         # Show pipeline structure if requested
         if args.show_structure:
-            print("⏳ Waiting for pipeline to initialize (2 seconds)...")
-            time.sleep(2)
+            print("⏳ Waiting for pipeline jobs to be created...")
+            analyzer = PipelineAnalyzer(gl, project)
+
+            # Poll briefly with growing delays; stop as soon as jobs exist
+            for delay in STRUCTURE_POLL_DELAYS:
+                if analyzer.get_all_jobs(pipeline.id):
+                    break
+                time.sleep(delay)
+                analyzer.clear_cache()
 
-            analyzer = PipelineAnalyzer(gl, project.id)
             analyzer.display_pipeline_summary(pipeline.id)
 
             # Show executable jobs